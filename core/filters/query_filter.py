@@ -3,7 +3,7 @@
 
 import logging
 from typing import Dict, Callable
-from utils.text.query import check_query_match
+from utils.text.query import QueryMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +15,9 @@ class QueryFilter:
         if not query:
             return lambda t: True
         
+        # Prepara a query uma única vez e reaproveita para todos os torrents
+        matcher = QueryMatcher(query)
+        
         def filter_func(torrent: Dict) -> bool:
             # Garante que todas as variáveis sejam strings (converte None para string vazia)
             title_processed = torrent.get('title_processed') or ''
@@ -28,8 +31,7 @@ class QueryFilter:
             title_translated = str(title_translated) if title_translated is not None else ''
             year = str(year).strip() if year is not None else ''
             
-            result = check_query_match(
-                query,
+            result = matcher.match(
                 title_processed,
                 original_title,
                 f"{title_translated} {year}".strip()
@@ -0,0 +1,96 @@
+import unittest
+from unittest import mock
+
+from utils.text import title_builder, title_helpers
+from utils.text.title_builder import (
+    _extract_bracket_tech,
+    _prepare_release_title_cached,
+    clear_title_caches,
+    create_standardized_title,
+    prepare_release_title,
+)
+
+
+class BracketTechTests(unittest.TestCase):
+    def setUp(self):
+        clear_title_caches()
+
+    def test_bracket_tech_grouped_by_category(self):
+        # Codec antes da qualidade no texto: o resultado mantém qualidade, fonte, codec, áudio
+        self.assertEqual(
+            _extract_bracket_tech('[DUAL][x264][WEB-DL][1080p] Show'),
+            ['1080p', 'WEB-DL', 'x264', 'DUAL'],
+        )
+
+    def test_codec_before_quality_brackets_in_release(self):
+        self.assertEqual(
+            prepare_release_title('[x264][1080p] Show S01E01', 'Show'),
+            'Show.S01E01.1080p.x264',
+        )
+
+    def test_codec_before_quality_brackets_in_standardized_title(self):
+        self.assertEqual(
+            create_standardized_title('Show', '', '[x264][1080p] Show S01E01'),
+            'Show.S01E01.1080p.x264',
+        )
+        self.assertEqual(
+            create_standardized_title('Movie', '2020', '[x265][2160p] Movie 2020'),
+            'Movie.2020.2160p.x265',
+        )
+
+
+class PrepareReleaseTitleCacheTests(unittest.TestCase):
+    INFO_HASH = 'a' * 40
+
+    def setUp(self):
+        clear_title_caches()
+
+    def tearDown(self):
+        clear_title_caches()
+
+    def _assert_wrapped_matches_cached(self, *args):
+        # prepare_release_title chama __wrapped__ quando info_hash é informado e a metadata pode ser consultada
+        uncached = prepare_release_title(*args, info_hash=self.INFO_HASH)
+        cached = _prepare_release_title_cached(*args, self.INFO_HASH, False)
+        self.assertEqual(uncached, cached)
+        self.assertEqual(prepare_release_title(*args, info_hash=self.INFO_HASH), cached)
+
+    def test_wrapped_path_matches_cached_path_with_metadata(self):
+        with mock.patch.object(title_builder, 'get_metadata_name', return_value='Show.S01E01.1080p.WEB-DL.x264-GRP'):
+            self._assert_wrapped_matches_cached('Show.S01E01.WEB-DL', 'Show', '', False)
+            self._assert_wrapped_matches_cached('', 'Show', '', True)
+
+    def test_wrapped_path_matches_cached_path_without_metadata(self):
+        with mock.patch.object(title_builder, 'get_metadata_name', return_value=None):
+            self._assert_wrapped_matches_cached('Show.S01E01.WEB-DL', 'Show', '', False)
+            self.assertEqual(
+                prepare_release_title('Show.S01E01.WEB-DL', 'Show', info_hash=self.INFO_HASH),
+                prepare_release_title('Show.S01E01.WEB-DL', 'Show', info_hash=self.INFO_HASH, skip_metadata=True),
+            )
+
+    def test_clear_title_caches_resets_all_caches(self):
+        with mock.patch.object(title_builder, 'get_metadata_name', return_value='Show.S01E01.1080p.WEB-DL.x264-GRP'):
+            prepare_release_title('Show.S01E01.WEB-DL', 'Show', info_hash=self.INFO_HASH)
+        prepare_release_title('Show S01E01 [1080p]', 'Show')
+        create_standardized_title('Show', '2020', 'Show.2020.S01E01.WEB-DL.1080p.x264')
+        create_standardized_title('Show', '', '', 'Show S01E01E02 WEB-DL 1080p')
+        create_standardized_title('', '', 'Show.S01E01.1080p')
+        cached_functions = [
+            value
+            for module in (title_builder, title_helpers)
+            for value in vars(module).values()
+            if hasattr(value, 'cache_info') and value.__module__ == module.__name__
+        ]
+        for function in cached_functions:
+            self.assertGreater(function.cache_info().currsize, 0, function.__name__)
+        self.assertTrue(title_builder._metadata_name_cache)
+
+        clear_title_caches()
+
+        for function in cached_functions:
+            self.assertEqual(function.cache_info().currsize, 0, function.__name__)
+        self.assertFalse(title_builder._metadata_name_cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+
+from utils.text.title_helpers import _reorder_title_components
+
+
+class MultiEpisodeTests(unittest.TestCase):
+    def setUp(self):
+        _reorder_title_components.cache_clear()
+
+    def test_multi_episode_formatted_sonarr_style(self):
+        # 2 episódios: hífen; 3-4: E repetido; 5+: intervalo
+        self.assertEqual(_reorder_title_components('Show.S02E01E02.1080p'), 'Show.S02E01-02.1080p')
+        self.assertEqual(_reorder_title_components('Show.S02e01e02e03.1080p'), 'Show.S02E01E02E03.1080p')
+        self.assertEqual(_reorder_title_components('Show.S02E01E02E03E04E05.WEB-DL'), 'Show.S02E01-E05.WEB-DL')
+
+    def test_invalid_sequence_kept_verbatim(self):
+        self.assertEqual(_reorder_title_components('Show.S01E03E02.1080p'), 'Show.S01E03E02.1080p')
+
+    def test_tag_at_start_not_repeated(self):
+        self.assertEqual(_reorder_title_components('S02E01E02E03.-.The.Office'), 'S02E01E02E03.-.The.Office')
+
+    def test_second_episode_tag_not_dropped(self):
+        self.assertEqual(
+            _reorder_title_components('Show.S01E05.S01E01E02.1080p'),
+            'Show.S01E05.1080p.S01E01E02',
+        )
+
+    def test_audio_channels_kept_after_size(self):
+        # O "1" de 1.5GB não pode descartar o "1" de DDP5.1
+        self.assertEqual(
+            _reorder_title_components('The.Office.S02E01E02E03.(2022).1.5GB.NACIONAL.DDP5.1'),
+            'The.Office.S02E01E02E03.NACIONAL.(2022).1.DDP5.1',
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
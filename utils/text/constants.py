@@ -26,6 +26,8 @@ RELEASE_CLEAN_REGEX = re.compile(
 # Regexes compiladas para melhor performance
 REGEX_MULTIPLE_SPACES = re.compile(r'\s+')
 REGEX_MULTIPLE_DOTS = re.compile(r'\.{2,}')
+REGEX_SPACES_OR_DOTS = re.compile(r'[\s\.]+')
+REGEX_NOT_WORD_OR_DOT = re.compile(r'[^\w\.]')
 REGEX_LEADING_TRAILING_DOTS = re.compile(r'^\.|\.$')
 REGEX_SPACE_AROUND_DOTS = re.compile(r'\s*\.\s*')
 REGEX_HTML_TAGS = re.compile(r'<[^>]+>')
@@ -1,12 +1,24 @@
 """Copyright (c) 2025 DFlexy"""
 """https://github.com/DFlexy"""
 
+import functools
 import html
 import re
-from typing import Optional
+import threading
+from collections import OrderedDict
+from itertools import groupby
+from typing import List, Optional, Tuple
 from urllib.parse import unquote
 
+from app.config import Config
 from utils.text.cleaning import clean_title, remove_accents
+from utils.text.constants import (
+    REGEX_MULTIPLE_SPACES,
+    REGEX_NOT_WORD_OR_DOT,
+    REGEX_SPACES_OR_DOTS,
+    REGEX_SPACE_AROUND_DOTS,
+    REGEX_NON_LATIN_CHARS,
+)
 from utils.text.storage import (
     get_metadata_name,
     is_release_title_incomplete,
@@ -22,35 +34,342 @@ from utils.text.title_helpers import (
     _reorder_title_components,
 )
 
+# Regexes compiladas para normalização do release/título
+_RE_BRACKET_TAG = re.compile(r'\[[^\]]*\]')
+_RE_PAREN = re.compile(r'\(([^)]+)\)')
+_RE_SXXEXX_TAIL = re.compile(r'\s*\(?\s*S\d{1,2}(E\d{1,2})?.*$', re.IGNORECASE)
+_RE_YEAR_TAIL = re.compile(r'\s*\(?\s*(19|20)\d{2}\s*\)?\s*$', re.IGNORECASE)
+_RE_YEAR = re.compile(r'(19|20)\d{2}')
 
-# Normaliza metadata name para formato padronizado (remove tags, normaliza espaços, remove duplicações)
-def _normalize_metadata_name(metadata_name: str) -> str:
-    """Normaliza metadata['name'] para formato padronizado antes de salvar no cross_data"""
-    normalized = metadata_name.strip()
-    normalized = html.unescape(normalized)
+# WEB-DL em qualquer grafia (WEB-DL, WEB.DL, WEB_DL, WEB DL, WEBDL)
+_RE_HAS_WEBDL = re.compile(r'web[-._ ]?dl', re.IGNORECASE)
+
+# Espaços, hífens e barras viram pontos no base_title
+_PUNCT_TO_DOT = str.maketrans({' ': '.', '-': '.', '/': '.'})
+
+# Informações técnicas dentro de colchetes ([720p], [WEB-DL], [x264], [DUAL]...) em uma única alternação
+# Cada categoria tem seu grupo nomeado para que o resultado saia agrupado na ordem abaixo
+_RE_BRACKET_TECH = re.compile(
+    r'\[(?:'
+    r'(?P<quality>1080p|720p|480p|2160p|4K|UHD|FHD|FULLHD|HD|SD|HDR)|'  # Qualidades
+    r'(?P<source>WEB-DL|WEBRip|BluRay|DVDRip|HDRip|HDTV|BDRip|BRRip|CAMRip|CAM|TSRip|TS|TC|R5|SCR|DVDScr)|'  # Fontes
+    r'(?P<codec>x264|x265|H\.264|H\.265|H264|H265|AVC|HEVC)|'  # Codecs
+    r'(?P<audio>DUAL|DUBLADO|DDP5\.1|Atmos|AC3|AAC|MP3|FLAC|DTS|NACIONAL|Legendado)'  # Áudio
+    r')\]',
+    re.IGNORECASE
+)
+_BRACKET_TECH_ORDER = {'quality': 0, 'source': 1, 'codec': 2, 'audio': 3}
+
+# Episódios múltiplos (S02E01-02-03, S02E01.02.03), tolerando espaços entre os números
+_RE_SEASON_MULTI = re.compile(r'S(\d{1,2})E(\d{1,2})(?:\s*[\.\-]\s*\d{1,2})+(?![0-9])', re.IGNORECASE)
+_RE_EP_NUMS = re.compile(r'[\.\-]\s*(\d{1,2})')
+
+# SxxExx simples e temporada isolada (Sx sem E logo depois)
+_RE_SXXEXX = re.compile(r'S(\d{1,2})E(\d{1,2})', re.IGNORECASE)
+_RE_SEASON_ONLY = re.compile(r'S(\d{1,2})(?![E\d])(?:[^E]|$)', re.IGNORECASE)
+# Toda regex de temporada começa com "S" + dígito (ſ casa com S em IGNORECASE): sem isso o release é filme
+_RE_SEASON_HINT = re.compile(r'[Ssſ]\d')
+
+# Partes técnicas literais do release (uma parte entre pontos), comparadas em casefold
+_TECHNICAL_PART_TOKENS = frozenset(token.casefold() for token in (
+    '1080p', '720p', '480p', '2160p', '4K', 'HD', 'FHD', 'UHD', 'SD', 'HDR', 'FULLHD',  # Qualidades
+    'x264', 'x265', 'H.264', 'H.265', 'H264', 'H265', 'AVC', 'HEVC',  # Codecs
+    'WEB-DL', 'WEBRip', 'BluRay', 'DVDRip', 'HDRip', 'HDTV', 'BDRip', 'BRRip',  # Fontes
+    'CAMRip', 'CAM', 'TSRip', 'TS', 'TC', 'R5', 'SCR', 'DVDScr',
+    'DUAL', 'DUBLADO', 'DDP5.1', 'Atmos', 'AC3', 'AAC', 'MP3', 'FLAC', 'DTS', 'NACIONAL', 'Legendado',  # Áudio
+    '5.1', '2.0', '7.1', 'DTS-HD', 'TrueHD',  # Outros técnicos
+    'MKV', 'MP4', 'AVI', 'MPEG', 'MOV',  # Formatos
+))
+# Codecs H264/H265 normalizados para H.264/H.265
+_H_CODEC_TOKENS = frozenset({'h264', 'h265'})
+
+# Partes técnicas que dependem de padrão (não literais)
+# Release groups (-SF, -RARBG) continuam sensíveis a maiúsculas, como antes
+_RE_TECHNICAL_PART = re.compile(
+    r'S\d{1,2}'  # Temporada: S01 (sem E)
+    r'|(?:19|20)\d{2}'  # Anos
+    r'|\d+\.\d+-[A-Z0-9]+'  # Padrões com hífen: 5.1-SF
+    r'|(?-i:-[A-Z0-9]+)'  # Release groups
+    r'|\d+\.?\d*\s*(?:GB|MB)',  # Tamanhos
+    re.IGNORECASE
+)
+# Toda parte que casa com _RE_TECHNICAL_PART começa com S (ſ casa com S em IGNORECASE), "-" ou dígito
+_PATTERN_PART_FIRST_CHARS = frozenset('Ssſ-')
+
+
+# Detecta escrita não-latina (cirílico, CJK, árabe...)
+# Todas as faixas de REGEX_NON_LATIN_CHARS começam em U+0370: texto ASCII ou Latin-1 (acentos PT-BR) nunca casa
+def _has_non_latin(text: str) -> bool:
+    if text.isascii():
+        return False
+    try:
+        text.encode('latin-1')
+        return False
+    except UnicodeEncodeError:
+        return REGEX_NON_LATIN_CHARS.search(text) is not None
+
+
+# Extrai informações técnicas de dentro dos colchetes, agrupadas por categoria
+def _extract_bracket_tech(text: str) -> List[str]:
+    # Ordenação estável: qualidade, fonte, codec, áudio; dentro de cada categoria, ordem do texto
+    matches = sorted(_RE_BRACKET_TECH.finditer(text), key=lambda match: _BRACKET_TECH_ORDER[match.lastgroup])
+    return [match.group(match.lastgroup) for match in matches]
+
+
+# Remove colchetes/parênteses preservando o que é técnico ([1080p] -> .1080p, "(BDRip 1080p)" -> "BDRip.1080p")
+def _expand_brackets(text: str, keep_bracket_tech: bool = True) -> str:
+    # Maioria dos títulos não tem colchetes: pula extração/remoção
+    if '[' in text:
+        # IMPORTANTE: Extrai informações técnicas de dentro dos colchetes ANTES de removê-los
+        # Padrões técnicos que podem estar em colchetes: [720p], [1080p], [WEBRip], [WEB-DL], [x264], [H264], etc.
+        technical_in_brackets = _extract_bracket_tech(text) if keep_bracket_tech else []
+        
+        # Remove tags entre colchetes (ex: [EA], [rich_jc], etc.)
+        # Mas preserva informações técnicas que foram extraídas acima
+        text = _RE_BRACKET_TAG.sub('', text)
+        
+        # Adiciona informações técnicas extraídas dos colchetes de volta ao texto (espaços viram pontos)
+        if technical_in_brackets:
+            text = '.'.join(filter(None, (REGEX_MULTIPLE_SPACES.sub('.', text.strip()), *technical_in_brackets)))
+    
+    # Remove parênteses mas preserva o conteúdo dentro deles (normaliza espaços para pontos)
+    # Ex: "(BDRip 1080p x264)" -> "BDRip.1080p.x264"
+    if '(' in text:
+        text = _RE_PAREN.sub(r'\1', text)
+    return text
+
+
+# Normaliza separadores para pontos e remove duplicações consecutivas
+# Ex: "S01E04.S01E04.2025..." -> "S01E04.2025..."
+def _collapse_release_parts(text: str) -> str:
+    # Normaliza espaços/pontos repetidos para um único ponto (uma passada) para facilitar detecção de duplicações
+    temp = REGEX_SPACES_OR_DOTS.sub('.', text.strip())
+    
+    # Remove duplicações consecutivas de qualquer parte (compara ignorando case)
+    parts = [part for part in (p.strip() for p in temp.split('.')) if part]
+    cleaned_parts = [next(group) for _, group in groupby(parts, key=str.lower)]
+    return '.'.join(cleaned_parts).strip('.')
+
+
+# Pipeline completo de limpeza de um nome de release (magnet dn / metadata name); função pura, memoizada
+@functools.lru_cache(maxsize=4096)
+def _normalize_release_string(text: str, keep_bracket_tech: bool = True) -> str:
+    normalized = html.unescape(text.strip())
     try:
         normalized = unquote(normalized)
     except Exception:
         pass
-    normalized = normalized.strip()
-    normalized = clean_title(normalized)
-    normalized = re.sub(r'\[[^\]]*\]', '', normalized)
-    normalized = re.sub(r'\(([^)]+)\)', lambda m: m.group(1).replace(' ', '.'), normalized)
-    temp_normalized = re.sub(r'\s+', '.', normalized.strip())
-    temp_normalized = re.sub(r'\.{2,}', '.', temp_normalized)
-    parts = temp_normalized.split('.')
-    cleaned_parts = []
-    prev_part = None
-    for part in parts:
-        part = part.strip()
-        if not part:
-            continue
-        part_lower = part.lower()
-        prev_lower = prev_part.lower() if prev_part else None
-        if part_lower != prev_lower:
-            cleaned_parts.append(part)
-            prev_part = part
-    return '.'.join(cleaned_parts).strip('.')
+    # Remove domínios e tags comuns (incluindo HIDRATORRENTS.ORG)
+    normalized = clean_title(normalized.strip())
+    normalized = _expand_brackets(normalized, keep_bracket_tech)
+    return _collapse_release_parts(normalized)
+
+
+# Normaliza metadata name para formato padronizado (remove tags, normaliza espaços, remove duplicações)
+def _normalize_metadata_name(metadata_name: str) -> str:
+    """Normaliza metadata['name'] para formato padronizado antes de salvar no cross_data"""
+    return _normalize_release_string(metadata_name, keep_bracket_tech=False)
+
+
+# Match do primeiro ano (19xx/20xx) do texto (até endpos, sem fatiar a string) ou None; sem "19"/"20" não roda a regex
+def _search_year(text: str, endpos: Optional[int] = None) -> Optional[re.Match]:
+    if endpos is None:
+        endpos = len(text)
+    if text.find('19', 0, endpos) < 0 and text.find('20', 0, endpos) < 0:
+        return None
+    return _RE_YEAR.search(text, 0, endpos)
+
+
+# Primeiro ano (19xx/20xx) do texto (até endpos) ou None
+def _find_year(text: str, endpos: Optional[int] = None) -> Optional[str]:
+    year_match = _search_year(text, endpos)
+    return year_match.group(0) if year_match else None
+
+
+# SxxExx/Sx exigem "S" seguido de dígito: filmes não passam pelas regexes de temporada
+def _may_have_season(text: str) -> bool:
+    return _RE_SEASON_HINT.search(text) is not None
+
+
+# Remove todos os anos (19xx/20xx) do texto; sem "19"/"20" não há o que remover e a regex é pulada
+def _strip_years(text: str) -> str:
+    if '19' not in text and '20' not in text:
+        return text
+    return _RE_YEAR.sub('', text)
+
+
+# Remove base_title do início do release aceitando um ponto opcional entre as letras
+# Ex: "One.Punch.Man.S03E01" -> "S03E01", "OnePunchManS03E01" -> "S03E01", "Paradise.2025.S01E01" -> "2025.S01E01"
+def _strip_base_from_release(clean_release: str, base_title: str) -> str:
+    base_no_dots = base_title.replace('.', '')
+    if not base_no_dots:
+        return clean_release
+    
+    # Varredura linear (equivale a ^B\.?a\.?s\.?e com IGNORECASE, sem montar/compilar regex por chamada)
+    length = len(clean_release)
+    pos = 0
+    for index, char in enumerate(base_no_dots):
+        if index and pos < length and clean_release[pos] == '.':
+            pos += 1
+        if pos >= length or (clean_release[pos] != char and clean_release[pos].lower() != char.lower()):
+            return clean_release
+        pos += 1
+    
+    if pos >= length:
+        return clean_release
+    # Base seguido de ponto: remove base e o ponto, preserva o que vem depois
+    if clean_release[pos] == '.':
+        return clean_release[pos + 1:]
+    # Base colado a SxxExx ou números (ex: "OnePunchManS03E01")
+    next_char = clean_release[pos]
+    if next_char in 'Ss' and pos + 1 < length and clean_release[pos + 1].isdecimal():
+        return clean_release[pos:]
+    if next_char.isdecimal() and not clean_release[pos - 1].isdecimal():
+        return clean_release[pos:]
+    return clean_release
+
+
+# Formata "Sxx" ou "SxxExx" com 2 dígitos a partir dos grupos da regex
+def _format_season_tag(season: str, episode: str = '') -> str:
+    if episode:
+        return f"S{season.zfill(2)}E{episode.zfill(2)}"
+    return f"S{season.zfill(2)}"
+
+
+# Detecta episódios múltiplos (S02E01-02-03, S02E01.02.03) e formata no padrão Sonarr
+# Retorna (season_ep_str, ano antes do SxxExx, restante após o match) ou None
+def _format_multi_episode(clean_release: str) -> Optional[Tuple[str, Optional[str], str]]:
+    season_ep_multi_match = _RE_SEASON_MULTI.search(clean_release)
+    if not season_ep_multi_match:
+        return None
+    
+    season = season_ep_multi_match.group(1).zfill(2)
+    episodes = [int(season_ep_multi_match.group(2))]
+    
+    # Extrai todos os números após o primeiro episódio (E01): -02, -03, .02, .03, etc.
+    max_episode = Config.MAX_EPISODE_NUMBER
+    max_diff = Config.MAX_EPISODE_DIFF
+    for ep_str in _RE_EP_NUMS.findall(season_ep_multi_match.group(0)):
+        ep_num = int(ep_str)
+        # Validação: cada episódio deve ser maior que o anterior, <= 99, e diferença <= 20
+        if ep_num > episodes[-1] and ep_num <= max_episode and (ep_num - episodes[-1]) <= max_diff:
+            episodes.append(ep_num)
+        else:
+            break  # Para se encontrar número inválido
+    
+    # Precisa de pelo menos 2 episódios válidos para formatar como múltiplos
+    if len(episodes) < 2:
+        return None
+    
+    # Padrão Sonarr:
+    # - 2 episódios: S02E01-02 (mantém hífen)
+    # - 3-4 episódios: S02E01E02E03 (E repetido - lista explícita)
+    # - 5+ episódios: S02E01-E05 (intervalo - primeiro-último)
+    if len(episodes) == 2:
+        season_ep_str = f"S{season}E{episodes[0]:02d}-{episodes[1]:02d}"
+    elif len(episodes) >= 5:
+        season_ep_str = f"S{season}E{episodes[0]:02d}-E{episodes[-1]:02d}"
+    else:
+        season_ep_str = f"S{season}E" + 'E'.join(f'{ep:02d}' for ep in episodes)
+    
+    # Extrai o ano que pode estar antes do SxxExx
+    year_from_release = _find_year(clean_release, season_ep_multi_match.start())
+    
+    return season_ep_str, year_from_release, clean_release[season_ep_multi_match.end():].strip('.')
+
+
+# Cache em memória (LRU limitado) dos nomes de metadata por info_hash, evita repetir Redis/iTorrents no mesmo processo
+_METADATA_NAME_CACHE_SIZE = 16384
+_metadata_name_cache = OrderedDict()  # info_hash -> metadata name
+_metadata_name_lock = threading.Lock()
+
+
+# Busca nome do metadata com memoização; só guarda resultados encontrados (falha de rede não fica presa no cache)
+def _cached_metadata_name(info_hash: str, skip_metadata: bool = False) -> Optional[str]:
+    if skip_metadata or not info_hash:
+        return None
+    key = info_hash.lower()
+    with _metadata_name_lock:
+        cached = _metadata_name_cache.get(key)
+        if cached is not None:
+            _metadata_name_cache.move_to_end(key)
+            return cached
+    
+    metadata_name = get_metadata_name(info_hash, skip_metadata=False)
+    if metadata_name:
+        with _metadata_name_lock:
+            _metadata_name_cache[key] = metadata_name
+            _metadata_name_cache.move_to_end(key)
+            if len(_metadata_name_cache) > _METADATA_NAME_CACHE_SIZE:
+                _metadata_name_cache.popitem(last=False)
+    return metadata_name
+
+
+# Título da página (original ou traduzido) -> base do título: "Fate/Stay Night (2024)" -> "Fate.Stay.Night"
+# O mesmo título da página se repete em todos os releases do item, então é memoizado
+@functools.lru_cache(maxsize=4096)
+def _base_title_from_page_title(page_title: str) -> str:
+    base_title = remove_accents(clean_title(page_title))
+    # Remove informações de temporada/ano do título da página
+    # IMPORTANTE: Só remove se for claramente temporada (S01, S1, S01E01) ou ano no final
+    # NÃO remove números que fazem parte do título (ex: "Fantastic 4", "Ocean's 11")
+    base_title = _RE_SXXEXX_TAIL.sub('', base_title)  # Remove SxxExx se houver
+    base_title = _RE_YEAR_TAIL.sub('', base_title)  # Remove ano no final
+    base_title = base_title.translate(_PUNCT_TO_DOT)  # Converte espaços, hífens e barras para pontos
+    base_title = REGEX_NOT_WORD_OR_DOT.sub('', base_title)  # Remove tudo exceto letras, números e pontos
+    base_title = base_title.strip('.')
+    # Capitaliza cada palavra após pontos (preserva capitalização correta: Fate.Stay.Night)
+    return '.'.join(word.capitalize() if word else '' for word in base_title.split('.'))
+
+
+# Release (magnet original ou processado) limpo, sem acentos e com colchetes expandidos, antes de remover o título base
+# Depende só do texto: o mesmo release com títulos de página diferentes reaproveita o resultado
+@functools.lru_cache(maxsize=8192)
+def _clean_release_text(release: str) -> str:
+    return _expand_brackets(remove_accents(clean_title(release)))
+
+
+# Extrai as informações técnicas do restante do release (após SxxExx/ano): ".1080p.WEB-DL.x264" ou ''
+# Depende só do texto, então é memoizada à parte (o mesmo release com títulos de página diferentes reaproveita)
+@functools.lru_cache(maxsize=8192)
+def _process_release_tail(text: str) -> str:
+    # Separa componentes colados antes de extrair informações técnicas
+    text = _split_technical_components(text)
+    text = _extract_technical_info(text)
+    # _extract_technical_info já devolve as partes não vazias unidas por '.', sem pontos nas bordas nem
+    # duplicados: o _clean_remaining se reduz a prefixar o separador
+    return '.' + text if text else ''
+
+
+# Mantém apenas as partes técnicas do release: temporada (S01 sem E), anos, qualidades, codecs, fontes, áudio,
+# outros técnicos (5.1, TrueHD), formatos (MKV), 5.1-SF, release groups (-SF) e tamanhos (GB/MB)
+def _extract_technical_parts(clean_release: str) -> str:
+    technical_parts = []
+    # clean_release já passou por _collapse_release_parts (sem espaços), basta descartar partes vazias
+    for part_clean in filter(None, clean_release.split('.')):
+        part_folded = part_clean.casefold()
+        if part_folded in _TECHNICAL_PART_TOKENS:
+            # Normaliza H264/H265 para H.264/H.265 antes de adicionar
+            if part_folded in _H_CODEC_TOKENS:
+                part_clean = f'H.{part_clean[1:]}'  # Converte H264 -> H.264
+            technical_parts.append(part_clean)
+        elif (part_clean[0] in _PATTERN_PART_FIRST_CHARS or part_clean[0].isdecimal()) and _RE_TECHNICAL_PART.fullmatch(part_clean):
+            technical_parts.append(part_clean)
+    return '.'.join(technical_parts)
+
+
+# Detecta SxxExx (múltiplos primeiro, depois episódio único com 2 dígitos)
+# Retorna (season_ep_str, ano antes do SxxExx, restante após o match) ou None
+def _format_season_episode(clean_release: str) -> Optional[Tuple[str, Optional[str], str]]:
+    multi_episode = _format_multi_episode(clean_release)
+    if multi_episode:
+        return multi_episode
+    
+    season_ep_match = _RE_SXXEXX.search(clean_release)
+    if not season_ep_match:
+        return None
+    season_ep_str = _format_season_tag(season_ep_match.group(1), season_ep_match.group(2))
+    return season_ep_str, _find_year(clean_release, season_ep_match.start()), clean_release[season_ep_match.end():]
 
 
 # Prepara magnet_processed: normaliza se válido, busca metadata se missing_dn=True, adiciona ano/WEB-DL se necessário
@@ -61,6 +380,24 @@ def prepare_release_title(
     missing_dn: bool = False,
     info_hash: Optional[str] = None,
     skip_metadata: bool = False
+) -> str:
+    # Normaliza os argumentos para chaves hasháveis e estáveis do cache (ex.: year int -> str)
+    args = (magnet_processed or '', fallback_title or '', str(year) if year else '', bool(missing_dn))
+    if info_hash and not skip_metadata:
+        # Pode consultar Redis/iTorrents: resultado depende de estado externo, não memoiza
+        return _prepare_release_title_cached.__wrapped__(*args, info_hash, False)
+    # Sem consulta de metadata o info_hash não altera o resultado: fica fora da chave para releases iguais reaproveitarem
+    return _prepare_release_title_cached(*args, None, bool(skip_metadata))
+
+
+@functools.lru_cache(maxsize=8192)
+def _prepare_release_title_cached(
+    magnet_processed: str,
+    fallback_title: str,
+    year: str,
+    missing_dn: bool,
+    info_hash: Optional[str],
+    skip_metadata: bool
 ) -> str:
     fallback_title = (fallback_title or '').strip()
     original_release_title = None
@@ -69,88 +406,18 @@ def prepare_release_title(
     # ETAPA 1: magnet_processed está vazio ou muito curto (< 3 caracteres)?
     magnet_processed = (magnet_processed or '').strip()
     
+    # Atalho: sem magnet, sem missing_dn e sem ano, o fallback já sem espaços sai como está (etapas 2-6 não o alteram)
+    if len(magnet_processed) < 3 and not missing_dn and not year and len(fallback_title) >= 3 and not REGEX_MULTIPLE_SPACES.search(fallback_title):
+        return fallback_title
+    
     if magnet_processed and len(magnet_processed) >= 3:
         # SIM: magnet_processed existe e tem >= 3 caracteres
-        # Normalizar (unescape, unquote, remover duplicações) e usar diretamente
-        normalized = magnet_processed
-        normalized = html.unescape(normalized)
-        try:
-            normalized = unquote(normalized)
-        except Exception:
-            pass
-        normalized = normalized.strip()
-        
-        # Remove domínios e tags comuns (incluindo HIDRATORRENTS.ORG)
-        from utils.text.cleaning import clean_title
-        normalized = clean_title(normalized)
-        
-        # IMPORTANTE: Extrai informações técnicas de dentro dos colchetes ANTES de removê-los
-        # Padrões técnicos que podem estar em colchetes: [720p], [1080p], [WEBRip], [WEB-DL], [x264], [H264], etc.
-        technical_in_brackets = []
-        
-        # Busca padrões técnicos dentro de colchetes
-        bracket_patterns = [
-            r'\[(1080p|720p|480p|2160p|4K|UHD|FHD|FULLHD|HD|SD|HDR)\]',  # Qualidades
-            r'\[(WEB-DL|WEBRip|BluRay|DVDRip|HDRip|HDTV|BDRip|BRRip|CAMRip|CAM|TSRip|TS|TC|R5|SCR|DVDScr)\]',  # Fontes
-            r'\[(x264|x265|H\.264|H\.265|H264|H265|AVC|HEVC)\]',  # Codecs
-            r'\[(DUAL|DUBLADO|DDP5\.1|Atmos|AC3|AAC|MP3|FLAC|DTS|NACIONAL|Legendado)\]',  # Áudio
-        ]
-        
-        for pattern in bracket_patterns:
-            matches = re.finditer(pattern, normalized, re.IGNORECASE)
-            for match in matches:
-                technical_in_brackets.append(match.group(1))  # Adiciona o conteúdo técnico encontrado
-        
-        # Remove tags entre colchetes (ex: [EA], [rich_jc], etc.)
-        # Mas preserva informações técnicas que foram extraídas acima
-        normalized = re.sub(r'\[[^\]]*\]', '', normalized)
-        
-        # Adiciona informações técnicas extraídas dos colchetes de volta ao normalized
-        if technical_in_brackets:
-            # Normaliza espaços para pontos e adiciona as informações técnicas
-            normalized = re.sub(r'\s+', '.', normalized.strip())
-            if normalized:
-                normalized += '.' + '.'.join(technical_in_brackets)
-            else:
-                normalized = '.'.join(technical_in_brackets)
-        
-        # Remove parênteses mas preserva o conteúdo dentro deles (normaliza espaços para pontos)
-        # Ex: "(BDRip 1080p x264)" -> "BDRip.1080p.x264"
-        normalized = re.sub(r'\(([^)]+)\)', lambda m: m.group(1).replace(' ', '.'), normalized)
-        
-        # Remove duplicações consecutivas do magnet_processed
-        # Ex: "S01E04.S01E04.2025..." -> "S01E04.2025..."
-        # Normaliza espaços para pontos para facilitar detecção de duplicações
-        temp_normalized = re.sub(r'\s+', '.', normalized.strip())
-        temp_normalized = re.sub(r'\.{2,}', '.', temp_normalized)
-        
-        parts = temp_normalized.split('.')
-        combined_parts = []
-        for part in parts:
-            clean_part = part.strip()
-            if clean_part:
-                combined_parts.append(clean_part)
-        
-        # Remove duplicações consecutivas de qualquer parte
-        cleaned_parts = []
-        prev_part = None
-        for part in combined_parts:
-            part = part.strip()
-            if not part:
-                continue
-            # Compara ignorando case e normalizando
-            part_lower = part.lower()
-            prev_lower = prev_part.lower() if prev_part else None
-            # Só adiciona se não for duplicação consecutiva
-            if part_lower != prev_lower:
-                cleaned_parts.append(part)
-                prev_part = part
-        
-        original_release_title = '.'.join(cleaned_parts).strip('.')
+        # Normalizar (unescape, unquote, tags/colchetes, remover duplicações) e usar diretamente
+        original_release_title = _normalize_release_string(magnet_processed)
         # DN curto/incompleto (ex.: só WEB-DL sem 1080p/x264): tenta metadata mais completo
         if info_hash and not skip_metadata:
             if is_release_title_incomplete(original_release_title):
-                metadata_name = get_metadata_name(info_hash, skip_metadata=skip_metadata)
+                metadata_name = _cached_metadata_name(info_hash, skip_metadata)
                 if metadata_name and _is_metadata_more_complete(
                     metadata_name, original_release_title
                 ):
@@ -166,7 +433,7 @@ def prepare_release_title(
             if info_hash:
                 # Busca metadata do iTorrents.org usando info_hash
                 if not skip_metadata:
-                    metadata_name = get_metadata_name(info_hash, skip_metadata=skip_metadata)
+                    metadata_name = _cached_metadata_name(info_hash, skip_metadata)
                     if metadata_name and len(metadata_name.strip()) >= 3:
                         # Metadata encontrado: normaliza e usa como original_release_title
                         # IMPORTANTE: Preserva FULLHD do metadata
@@ -202,27 +469,24 @@ def prepare_release_title(
     # Normaliza espaços múltiplos, mas preserva pontos
     if '.' in original_release_title:
         # Tem pontos - normaliza apenas espaços múltiplos entre palavras (não entre pontos)
-        original_release_title = re.sub(r'\s+', ' ', original_release_title)
+        original_release_title = REGEX_MULTIPLE_SPACES.sub(' ', original_release_title)
         # Remove espaços ao redor de pontos
-        original_release_title = re.sub(r'\s*\.\s*', '.', original_release_title)
+        original_release_title = REGEX_SPACE_AROUND_DOTS.sub('.', original_release_title)
     else:
         # Não tem pontos - normaliza espaços
-        original_release_title = re.sub(r'\s+', ' ', original_release_title).strip()
+        original_release_title = REGEX_MULTIPLE_SPACES.sub(' ', original_release_title).strip()
 
     # ETAPA 5: O ano (year) foi fornecido e NÃO está no título?
-    if year:
-        year_str = str(year)
-        if year_str and year_str not in original_release_title:
-            # Adiciona ano ao final
-            if '.' in original_release_title:
-                original_release_title = f"{original_release_title}.{year_str}".strip()
-            else:
-                original_release_title = f"{original_release_title} {year_str}".strip()
+    # year já chega normalizado para str por prepare_release_title
+    if year and year not in original_release_title:
+        # Adiciona ano ao final
+        if '.' in original_release_title:
+            original_release_title = f"{original_release_title}.{year}".strip()
         else:
-            pass
+            original_release_title = f"{original_release_title} {year}".strip()
 
     # ETAPA 6: missing_dn = True após todo processamento?
-    if final_missing_dn and original_release_title and 'web-dl' not in original_release_title.lower():
+    if final_missing_dn and original_release_title and not _RE_HAS_WEBDL.search(original_release_title):
         # Adiciona WEB-DL ao final
         if '.' in original_release_title:
             original_release_title = f"{original_release_title}.WEB-DL".strip()
@@ -237,6 +501,13 @@ def prepare_release_title(
 
 # Constrói o título padronizado final (Title.SxxEyy.Year….)
 def create_standardized_title(title_original_html: str, year: str, magnet_processed: str, title_translated_html: Optional[str] = None, magnet_original: Optional[str] = None) -> str:
+    # Normaliza year uma vez (int 2024 e "2024" viram a mesma chave do cache)
+    year = str(year) if year else ''
+    return _create_standardized_title_cached(title_original_html, year, magnet_processed, title_translated_html, magnet_original)
+
+
+@functools.lru_cache(maxsize=8192)
+def _create_standardized_title_cached(title_original_html: str, year: str, magnet_processed: str, title_translated_html: Optional[str], magnet_original: Optional[str]) -> str:
     
     def finalize_title(value: str) -> str:
         # Usa magnet_original se disponível (preserva informação original como "1ª Temporada")
@@ -245,52 +516,32 @@ def create_standardized_title(title_original_html: str, year: str, magnet_proces
         value = _apply_season_temporada_tags(value, release_for_season_detection, title_original_html, year)
         value = _reorder_title_components(value)
         return _ensure_default_format(value)
+    
+    def assemble_title(base: str, *components: Optional[str]) -> str:
+        # Junta base + componentes não vazios com um único join (processed_magnet_text já vem com "." inicial)
+        return finalize_title('.'.join((base, *(component.lstrip('.') for component in components if component))))
+    
     # Determina base_title seguindo fallback
     base_title = ''
     
     # Verifica se tem título original válido
     if title_original_html and title_original_html.strip():
         # Verifica se tem caracteres não-latinos (Russo, Chinês, Coreano, Japonês, Tailandês, Hindi/Devanagari/Bengali, Árabe, Hebreu, Grego, Telugu, Tamil, Kannada, Malayalam, Gujarati, Oriya)
-        has_non_latin = bool(re.search(r'[\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff\uac00-\ud7af\u0400-\u04ff\u0e00-\u0e7f\u0900-\u09ff\u0600-\u06ff\u0590-\u05ff\u0370-\u03ff\u0c00-\u0c7f\u0b80-\u0bff\u0c80-\u0cff\u0d00-\u0d7f\u0a80-\u0aff\u0b00-\u0b7f]', title_original_html))
+        has_non_latin = _has_non_latin(title_original_html)
         
         if not has_non_latin:
             # Título Original da página: Como base principal (apenas o nome, sem SxxExx, ano, etc.)
-            base_title = clean_title(title_original_html)
-            base_title = remove_accents(base_title)
-            # Remove informações de temporada/ano do título da página
-            # IMPORTANTE: Só remove se for claramente temporada (S01, S1, S01E01) ou ano no final
-            # NÃO remove números que fazem parte do título (ex: "Fantastic 4", "Ocean's 11")
-            base_title = re.sub(r'(?i)\s*\(?\s*S\d{1,2}(E\d{1,2})?.*$', '', base_title)  # Remove SxxExx se houver
-            base_title = re.sub(r'(?i)\s*\(?\s*(19|20)\d{2}\s*\)?\s*$', '', base_title)  # Remove ano no final
-            base_title = base_title.replace(' ', '.').replace('-', '.').replace('/', '.')  # Converte espaços, hífens e barras para pontos
-            base_title = re.sub(r'[^\w\.]', '', base_title)  # Remove tudo exceto letras, números e pontos
-            base_title = base_title.strip('.')
-            # Capitaliza cada palavra após pontos (preserva capitalização correta: Fate.Stay.Night)
-            base_title = '.'.join(word.capitalize() if word else '' for word in base_title.split('.'))
+            base_title = _base_title_from_page_title(title_original_html)
             
             # Continua processando magnet_processed para extrair SxxExx, ano e informações técnicas
             # Não retorna direto, sempre processa o magnet_processed
         else:
             # Fallback1: Title Não-latinos Ex:Russo/Koreano
-            # Verifica se magnet_processed (raw) também tem caracteres não-latinos
-            # Usa magnet_original se disponível, senão usa magnet_processed
-            raw_to_check = magnet_original if magnet_original else magnet_processed
-            release_has_non_latin = bool(re.search(r'[\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff\uac00-\ud7af\u0400-\u04ff\u0e00-\u0e7f\u0900-\u09ff\u0600-\u06ff\u0590-\u05ff\u0370-\u03ff\u0c00-\u0c7f\u0b80-\u0bff\u0c80-\u0cff\u0d00-\u0d7f\u0a80-\u0aff\u0b00-\u0b7f]', raw_to_check or ''))
-            
             # Se title_translated_html existe, usa ele (é preferível ao magnet_processed quando original tem não-latinos)
             if title_translated_html and title_translated_html.strip():
                 # Fallback1.1: Título Traduzido da página quando title_original_html tem não-latinos
                 # Usa title_translated_html mesmo se magnet_processed não tem não-latinos
-                base_title = clean_title(title_translated_html)
-                base_title = remove_accents(base_title)
-                # Remove informações de temporada/ano do título traduzido (apenas o nome base)
-                base_title = re.sub(r'(?i)\s*\(?\s*S\d{1,2}(E\d{1,2})?.*$', '', base_title)  # Remove SxxExx se houver
-                base_title = re.sub(r'(?i)\s*\(?\s*(19|20)\d{2}\s*\)?\s*$', '', base_title)  # Remove ano no final
-                base_title = base_title.replace(' ', '.').replace('-', '.').replace('/', '.')  # Converte espaços, hífens e barras para pontos
-                base_title = re.sub(r'[^\w\.]', '', base_title)  # Remove tudo exceto letras, números e pontos
-                base_title = base_title.strip('.')
-                # Capitaliza cada palavra após pontos (preserva capitalização correta: Fate.Stay.Night)
-                base_title = '.'.join(word.capitalize() if word else '' for word in base_title.split('.'))
+                base_title = _base_title_from_page_title(title_translated_html)
                 # Continua processando magnet_processed para extrair SxxExx, ano e informações técnicas
             else:
                 # Fallback1: Usar title do magnet (magnet_processed) - extrai apenas o nome base
@@ -308,423 +559,112 @@ def create_standardized_title(title_original_html: str, year: str, magnet_proces
     # Prefere magnet_original quando disponível porque preserva a estrutura original
     if magnet_original and magnet_original.strip():
         # Usa magnet_original se disponível (vem do magnet/Redis com estrutura preservada)
-        clean_release = clean_title(magnet_original)
+        clean_release = _clean_release_text(magnet_original)
     elif magnet_processed and magnet_processed.strip():
         # Usa magnet_processed (resultado de prepare_release_title) como fallback
-        clean_release = clean_title(magnet_processed)
+        clean_release = _clean_release_text(magnet_processed)
     else:
         # Se ambos estão vazios, retorna apenas base_title
         result = finalize_title(base_title)
         return result
-    clean_release = remove_accents(clean_release)
-    
-    # IMPORTANTE: Extrai informações técnicas de dentro dos colchetes ANTES de removê-los
-    # Padrões técnicos que podem estar em colchetes: [720p], [1080p], [WEBRip], [WEB-DL], [x264], [H264], etc.
-    technical_in_brackets = []
-    
-    # Busca padrões técnicos dentro de colchetes
-    bracket_patterns = [
-        r'\[(1080p|720p|480p|2160p|4K|UHD|FHD|FULLHD|HD|SD|HDR)\]',  # Qualidades
-        r'\[(WEB-DL|WEBRip|BluRay|DVDRip|HDRip|HDTV|BDRip|BRRip|CAMRip|CAM|TSRip|TS|TC|R5|SCR|DVDScr)\]',  # Fontes
-        r'\[(x264|x265|H\.264|H\.265|H264|H265|AVC|HEVC)\]',  # Codecs
-        r'\[(DUAL|DUBLADO|DDP5\.1|Atmos|AC3|AAC|MP3|FLAC|DTS|NACIONAL|Legendado)\]',  # Áudio
-    ]
-    
-    for pattern in bracket_patterns:
-        matches = re.finditer(pattern, clean_release, re.IGNORECASE)
-        for match in matches:
-            technical_in_brackets.append(match.group(1))  # Adiciona o conteúdo técnico encontrado
-    
-    # Remove tags entre colchetes (ex: [EA], [rich_jc], etc.)
-    # Mas preserva informações técnicas que foram extraídas acima
-    clean_release = re.sub(r'\[[^\]]*\]', '', clean_release)
-    
-    # Adiciona informações técnicas extraídas dos colchetes de volta ao clean_release
-    if technical_in_brackets:
-        # Normaliza espaços para pontos e adiciona as informações técnicas
-        clean_release = re.sub(r'\s+', '.', clean_release.strip())
-        if clean_release:
-            clean_release += '.' + '.'.join(technical_in_brackets)
-        else:
-            clean_release = '.'.join(technical_in_brackets)
-    
-    # Remove parênteses mas preserva o conteúdo dentro deles (normaliza espaços para pontos)
-    # Ex: "(BDRip 1080p x264)" -> "BDRip.1080p.x264"
-    clean_release = re.sub(r'\(([^)]+)\)', lambda m: m.group(1).replace(' ', '.'), clean_release)
     
     # Remove o base_title do clean_release antes de processar (evita duplicação)
-    # Normaliza ambos removendo pontos e espaços para comparação
-    base_title_normalized = re.sub(r'[\.\s]', '', base_title).lower()
-    clean_release_normalized = re.sub(r'[\.\s]', '', clean_release).lower()
-    
-    # Se o base_title está no início do clean_release, remove
-    if clean_release_normalized.startswith(base_title_normalized):
-        # Encontra onde o base_title termina no clean_release original (considerando pontos)
-        # Procura o padrão do base_title no início do clean_release, aceitando pontos opcionais
-        base_no_dots = base_title.replace('.', '')
-        # Cria padrão que aceita pontos opcionais entre letras do base_title
-        # Ex: "One Punch-Man" pode corresponder a "One.Punch.Man" ou "OnePunchMan"
-        if len(base_no_dots) > 0:
-            base_pattern = re.escape(base_no_dots[0])  # Primeira letra (obrigatória)
-            for char in base_no_dots[1:]:
-                base_pattern += rf'\.?{re.escape(char)}'  # Letras seguintes com ponto opcional
-            
-            # Remove base_title do início (seguido de ponto, SxxExx, número, ou fim)
-            # Também remove se estiver colado a SxxExx ou números (ex: "OnePunchManS03E01")
-            # IMPORTANTE: Remove o base_title e qualquer ponto que o segue, mas preserva o que vem depois
-            # Ex: "One.Punch.Man.S03E01" -> "S03E01"
-            # Ex: "OnePunchManS03E01" -> "S03E01"
-            # Ex: "Paradise.2025.S01E01" -> "2025.S01E01" (preserva o ano)
-            # Remove base_title seguido de ponto (ou colado a SxxExx/números)
-            # Mas preserva o que vem depois do ponto
-            match = re.match(rf'^{base_pattern}(\.)', clean_release, flags=re.IGNORECASE)
-            if match:
-                # Remove base_title e o ponto que o segue
-                clean_release = clean_release[match.end():]
-            else:
-                # Tenta remover se estiver colado (sem ponto)
-                clean_release = re.sub(rf'^{base_pattern}(?=S\d|(?<!\d)\d)', '', clean_release, flags=re.IGNORECASE)
-        
-        # Limpa pontos duplicados que podem ter ficado
-        clean_release = re.sub(r'^\.+', '', clean_release)
+    # A varredura já compara sem diferenciar maiúsculas e para no primeiro caractere divergente
+    # Pontos iniciais que sobrarem são removidos por _collapse_release_parts
+    clean_release = _strip_base_from_release(clean_release, base_title)
     
     # Remove duplicações consecutivas do clean_release antes de processar
     # Ex: "S01E04.S01E04.2025..." -> "S01E04.2025..."
-    # Normaliza espaços para pontos para facilitar detecção de duplicações
-    temp_clean = re.sub(r'\s+', '.', clean_release.strip())
-    temp_clean = re.sub(r'\.{2,}', '.', temp_clean)
-    
-    # Remove duplicações consecutivas de qualquer parte
-    parts = temp_clean.split('.')
-    cleaned_parts = []
-    prev_part = None
-    for part in parts:
-        part = part.strip()
-        if not part:
-            continue
-        # Compara ignorando case e normalizando
-        part_lower = part.lower()
-        prev_lower = prev_part.lower() if prev_part else None
-        # Só adiciona se não for duplicação consecutiva
-        if part_lower != prev_lower:
-            cleaned_parts.append(part)
-            prev_part = part
-    
-    clean_release = '.'.join(cleaned_parts).strip('.')
-    
-    # EPISÓDIOS MÚLTIPLOS: Formato Sonarr compatível - detecta antes de normalizar espaços
-    # Regex para detectar múltiplos episódios: S02E01-02-03, S02E01-02, S02E01.02.03, etc.
-    # Padrão Sonarr:
-    # - 2 episódios: S02E01-02 (hífen)
-    # - 3+ episódios: S02E01E02E03 (E repetido - lista explícita) ou S02E01-E05 (intervalo)
-    # Busca padrão completo: S02E01-02-03 ou S02E01.02.03
-    # Usa lookahead negativo para garantir que não capture ano (2025)
-    season_ep_multi_match = re.search(r'(?i)S(\d{1,2})E(\d{1,2})(?:\s*[\.\-]\s*\d{1,2}){1,}(?![0-9])', clean_release)
-    
-    if not season_ep_multi_match:
-        # Tenta padrão alternativo sem espaços
-        alt_match = re.search(r'(?i)S(\d{1,2})E(\d{1,2})(?:[\.\-]\d{1,2}){1,}(?![0-9])', clean_release)
-        if alt_match:
-            season_ep_multi_match = alt_match
-    
-    if season_ep_multi_match:
-        season = season_ep_multi_match.group(1).zfill(2)
-        episode1 = int(season_ep_multi_match.group(2))
-        
-        # Extrai todos os episódios do match completo
-        full_match = season_ep_multi_match.group(0)
-        episodes = [episode1]
-        
-        # Extrai todos os números após o primeiro episódio (E01)
-        # Busca por padrão: -02, -03, .02, .03, etc. (sem espaços após normalização)
-        episode_numbers = re.findall(r'[\.\-]\s*(\d{1,2})', full_match)
-        
-        for ep_str in episode_numbers:
-            ep_num = int(ep_str)
-            # Validação: cada episódio deve ser maior que o anterior, <= 99, e diferença <= 20
-            from app.config import Config
-            if ep_num > episodes[-1] and ep_num <= Config.MAX_EPISODE_NUMBER and (ep_num - episodes[-1]) <= Config.MAX_EPISODE_DIFF:
-                episodes.append(ep_num)
-            else:
-                break  # Para se encontrar número inválido
-        
-        # Se tem pelo menos 2 episódios válidos, formata como múltiplos
-        if len(episodes) >= 2:
-            # Novo padrão Sonarr:
-            # - 2 episódios: S02E01-02 (mantém hífen)
-            # - 3-4 episódios: S02E01E02E03 (E repetido - lista explícita)
-            # - 5+ episódios: S02E01-E05 (intervalo - primeiro-último)
-            if len(episodes) == 2:
-                # Duplos: mantém formato com hífen
-                episode_str = '-'.join(str(ep).zfill(2) for ep in episodes)
-                season_ep_str = f"S{season}E{episode_str}"
-            elif len(episodes) >= 5:
-                # 5+ episódios: usa formato de intervalo (primeiro-último)
-                first_ep = str(episodes[0]).zfill(2)
-                last_ep = str(episodes[-1]).zfill(2)
-                season_ep_str = f"S{season}E{first_ep}-E{last_ep}"
-            elif len(episodes) >= 3:
-                # 3-4 episódios: usa E repetido para lista explícita
-                episode_str = 'E'.join(str(ep).zfill(2) for ep in episodes)
-                season_ep_str = f"S{season}E{episode_str}"
-            else:
-                # Fallback (não deveria acontecer)
-                episode_str = '-'.join(str(ep).zfill(2) for ep in episodes)
-                season_ep_str = f"S{season}E{episode_str}"
-            
-            # Extrai o ano que pode estar antes do SxxExx
-            year_from_release = None
-            text_before_season = clean_release[:season_ep_multi_match.start()]
-            if text_before_season:
-                year_match = re.search(r'(19|20)\d{2}', text_before_season)
-                if year_match:
-                    year_from_release = year_match.group(0)
-            
-            # Normaliza espaços para pontos no restante (após SxxExxExx...)
-            original_magnet_text = clean_release[season_ep_multi_match.end():]
-            original_magnet_text = re.sub(r'\s+', '.', original_magnet_text)
-            original_magnet_text = re.sub(r'\.{2,}', '.', original_magnet_text)
-            original_magnet_text = original_magnet_text.strip('.')
-            # Separa componentes colados antes de extrair informações técnicas
-            original_magnet_text = _split_technical_components(original_magnet_text)
-            
-            processed_magnet_text = _extract_technical_info(original_magnet_text)
-            processed_magnet_text = _clean_remaining(processed_magnet_text)
-            
-            # Monta o título: base_title + season_ep + ano (se encontrado) + informações técnicas
-            # Ordem correta: Título.SxxExx.Ano.Qualidade.Codec
-            if year_from_release:
-                result = finalize_title(f"{base_title}.{season_ep_str}.{year_from_release}{processed_magnet_text}")
-            else:
-                result = finalize_title(f"{base_title}.{season_ep_str}{processed_magnet_text}")
-            
-            return result
-    
-    # Normaliza espaços para pontos para facilitar processamento
-    clean_release = re.sub(r'\s+', '.', clean_release)
-    clean_release = re.sub(r'\.{2,}', '.', clean_release)
-    clean_release = clean_release.strip('.')
+    # Também normaliza espaços para pontos (sem pontos repetidos nem nas pontas)
+    clean_release = _collapse_release_parts(clean_release)
     
     # IMPORTANTE: NÃO chama _split_technical_components aqui porque quebra S01E01 em S01E.01
     # _split_technical_components só deve ser chamada no texto APÓS S01E01, não no clean_release completo
     
-    # EPISÓDIOS MÚLTIPLOS: detecta após normalizar também
-    # Regex para detectar múltiplos episódios após normalização
-    season_ep_multi_match = re.search(r'(?i)S(\d{1,2})E(\d{1,2})(?:[\.\-]\d{1,2}){1,}(?![0-9])', clean_release)
+    # Filmes (sem "S" + dígito) pulam toda a detecção de temporada/episódio
+    may_have_season = _may_have_season(clean_release)
     
-    if season_ep_multi_match:
-        season = season_ep_multi_match.group(1).zfill(2)
-        episode1 = int(season_ep_multi_match.group(2))
-        
-        # Extrai todos os episódios do match completo
-        full_match = season_ep_multi_match.group(0)
-        episodes = [episode1]
+    # EPISÓDIOS: múltiplos no formato Sonarr (S02E01-02, S02E01E02E03, S02E01-E05) ou Title.S02E01.restodomagnet
+    season_episode = _format_season_episode(clean_release) if may_have_season else None
+    if season_episode:
+        season_ep_str, year_from_release, original_magnet_text = season_episode
+        processed_magnet_text = _process_release_tail(original_magnet_text)
         
-        # Extrai todos os números após o primeiro episódio (E01)
-        # Busca por padrão: -02, -03, .02, .03, etc.
-        episode_numbers = re.findall(r'[\.\-](\d{1,2})', full_match)
-        for ep_str in episode_numbers:
-            ep_num = int(ep_str)
-            # Validação: cada episódio deve ser maior que o anterior, <= 99, e diferença <= 20
-            from app.config import Config
-            if ep_num > episodes[-1] and ep_num <= Config.MAX_EPISODE_NUMBER and (ep_num - episodes[-1]) <= Config.MAX_EPISODE_DIFF:
-                episodes.append(ep_num)
-            else:
-                break  # Para se encontrar número inválido
-        
-        # Se tem pelo menos 2 episódios válidos, formata como múltiplos
-        if len(episodes) >= 2:
-            # Novo padrão Sonarr:
-            # - 2 episódios: S02E01-02 (mantém hífen)
-            # - 3-4 episódios: S02E01E02E03 (E repetido - lista explícita)
-            # - 5+ episódios: S02E01-E05 (intervalo - primeiro-último)
-            if len(episodes) == 2:
-                # Duplos: mantém formato com hífen
-                episode_str = '-'.join(str(ep).zfill(2) for ep in episodes)
-                season_ep_str = f"S{season}E{episode_str}"
-            elif len(episodes) >= 5:
-                # 5+ episódios: usa formato de intervalo (primeiro-último)
-                first_ep = str(episodes[0]).zfill(2)
-                last_ep = str(episodes[-1]).zfill(2)
-                season_ep_str = f"S{season}E{first_ep}-E{last_ep}"
-            elif len(episodes) >= 3:
-                # 3-4 episódios: usa E repetido para lista explícita
-                episode_str = 'E'.join(str(ep).zfill(2) for ep in episodes)
-                season_ep_str = f"S{season}E{episode_str}"
-            else:
-                # Fallback (não deveria acontecer)
-                episode_str = '-'.join(str(ep).zfill(2) for ep in episodes)
-                season_ep_str = f"S{season}E{episode_str}"
-            
-            # Extrai o ano que pode estar antes do SxxExx
-            year_from_release = None
-            text_before_season = clean_release[:season_ep_multi_match.start()]
-            if text_before_season:
-                year_match = re.search(r'(19|20)\d{2}', text_before_season)
-                if year_match:
-                    year_from_release = year_match.group(0)
-            
-            # Extrai apenas informações técnicas do restante (após SxxExxExx...)
-            original_magnet_text = clean_release[season_ep_multi_match.end():]
-            # Separa componentes colados antes de extrair informações técnicas
-            original_magnet_text = _split_technical_components(original_magnet_text)
-            processed_magnet_text = _extract_technical_info(original_magnet_text)
-            processed_magnet_text = _clean_remaining(processed_magnet_text)
-            
-            # Monta o título: base_title + season_ep + ano (se encontrado) + informações técnicas
-            # Ordem correta: Título.SxxExx.Ano.Qualidade.Codec
-            if year_from_release:
-                result = finalize_title(f"{base_title}.{season_ep_str}.{year_from_release}{processed_magnet_text}")
-            else:
-                result = finalize_title(f"{base_title}.{season_ep_str}{processed_magnet_text}")
-            
-            return result
-    
-    # EPISÓDIOS: Title.S02E01.restodomagnet (2 dígitos) - detecta ANTES de filtrar
-    season_ep_match = re.search(r'(?i)S(\d{1,2})E(\d{1,2})', clean_release)
-    
-    if season_ep_match:
-        season = season_ep_match.group(1).zfill(2)  # 2 dígitos
-        episode = season_ep_match.group(2).zfill(2)  # 2 dígitos
-        season_ep_str = f"S{season}E{episode}"
-        
-        # Extrai o ano que pode estar antes do SxxExx
-        year_from_release = None
-        text_before_season = clean_release[:season_ep_match.start()]
-        if text_before_season:
-            year_match = re.search(r'(19|20)\d{2}', text_before_season)
-            if year_match:
-                year_from_release = year_match.group(0)
-        
-        # Extrai apenas informações técnicas do restante (após SxxExx)
-        original_magnet_text = clean_release[season_ep_match.end():]
-        # Separa componentes colados antes de extrair informações técnicas
-        original_magnet_text = _split_technical_components(original_magnet_text)
-        processed_magnet_text = _extract_technical_info(original_magnet_text)
-        processed_magnet_text = _clean_remaining(processed_magnet_text)
-        
-        # Monta o título: base_title + season_ep + ano (se encontrado) + informações técnicas
+        # Monta o título: base_title + season_ep + ano (se encontrado, vazio é ignorado) + informações técnicas
         # Ordem correta: Título.SxxExx.Ano.Qualidade.Codec
-        if year_from_release:
-            return finalize_title(f"{base_title}.{season_ep_str}.{year_from_release}{processed_magnet_text}")
-        else:
-            return finalize_title(f"{base_title}.{season_ep_str}{processed_magnet_text}")
+        return assemble_title(base_title, season_ep_str, year_from_release, processed_magnet_text)
     
     # Extrai apenas informações técnicas do magnet_processed, removendo qualquer título
     # Padrões técnicos: Sx, anos, qualidades, codecs, etc.
-    
-    technical_parts = []
-    parts = clean_release.split('.')
-    
-    for part in parts:
-        part_clean = part.strip()
-        if not part_clean:
-            continue
-        
-        # Mantém apenas:
-        # - Padrões de temporada: S01 (sem E)
-        if re.match(r'^S\d{1,2}$', part_clean, re.IGNORECASE):
-            technical_parts.append(part_clean)
-        # - Anos: 2025, 2024, etc.
-        elif re.match(r'^(19|20)\d{2}$', part_clean):
-            technical_parts.append(part_clean)
-        # - Qualidades: 1080p, 720p, 2160p, 4K, HD, FHD, UHD, FULLHD, etc.
-        elif re.match(r'^(1080p|720p|480p|2160p|4K|HD|FHD|UHD|SD|HDR|FULLHD)$', part_clean, re.IGNORECASE):
-            technical_parts.append(part_clean)
-        # - Codecs: x264, x265, H.264, H.265, H264, H265, etc.
-        # Normaliza H264/H265 para H.264/H.265 antes de adicionar
-        elif re.match(r'^(x264|x265|H\.264|H\.265|H264|H265|AVC|HEVC)$', part_clean, re.IGNORECASE):
-            # Normaliza H264/H265 para H.264/H.265
-            if re.match(r'^H(264|265)$', part_clean, re.IGNORECASE):
-                part_clean = f'H.{part_clean[1:]}'  # Converte H264 -> H.264
-            technical_parts.append(part_clean)
-        # - Fontes: WEB-DL, WEBRip, BluRay, DVDRip, HDRip, HDTV, BDRip, BRRip, etc.
-        elif re.match(r'^(WEB-DL|WEBRip|BluRay|DVDRip|HDRip|HDTV|BDRip|BRRip|CAMRip|CAM|TSRip|TS|TC|R5|SCR|DVDScr)$', part_clean, re.IGNORECASE):
-            technical_parts.append(part_clean)
-        # - Áudio: DUAL, DUBLADO, DDP5.1, Atmos, AC3, AAC, etc.
-        elif re.match(r'^(DUAL|DUBLADO|DDP5\.1|Atmos|AC3|AAC|MP3|FLAC|DTS|NACIONAL|Legendado)$', part_clean, re.IGNORECASE):
-            technical_parts.append(part_clean)
-        # - Outros técnicos: HDR, 5.1, 2.0, etc.
-        elif re.match(r'^(HDR|5\.1|2\.0|7\.1|DTS-HD|TrueHD)$', part_clean, re.IGNORECASE):
-            technical_parts.append(part_clean)
-        # - Formatos: MKV, MP4, AVI, etc.
-        elif re.match(r'^(MKV|MP4|AVI|MPEG|MOV)$', part_clean, re.IGNORECASE):
-            technical_parts.append(part_clean)
-        # - Padrões com hífen: 5.1-SF, etc. (número.ponto.número-hífen-letras/números)
-        elif re.match(r'^\d+\.\d+-[A-Z0-9]+$', part_clean, re.IGNORECASE):
-            technical_parts.append(part_clean)
-        # - Release groups: -SF, -RARBG, etc. (começam com -)
-        elif re.match(r'^-[A-Z0-9]+$', part_clean):
-            technical_parts.append(part_clean)
-        # - Números seguidos de GB/MB (tamanhos)
-        elif re.match(r'^\d+\.?\d*\s*(GB|MB)$', part_clean, re.IGNORECASE):
-            technical_parts.append(part_clean)
-    
-    clean_release = '.'.join(technical_parts)
+    clean_release = _extract_technical_parts(clean_release)
     
     # SÉRIES COMPLETAS: Title.S2.2022.restodomagnet (1 dígito para temporada)
     # IMPORTANTE: Não faz match se houver E seguido de dígitos logo depois (ex: S01E01)
-    season_only_match = re.search(r'(?i)S(\d{1,2})(?![E\d])(?:[^E]|$)', clean_release)
+    # As partes técnicas são trechos do clean_release, então sem "S" + dígito nele também não há Sx aqui
+    season_only_match = _RE_SEASON_ONLY.search(clean_release) if may_have_season else None
     if season_only_match:
         season_num_raw = season_only_match.group(1)
         # IMPORTANTE: Valida que o número da temporada é válido (maior que 0)
-        # Evita gerar S00 incorretamente
-        try:
-            season_num = int(season_num_raw)
-            if season_num <= 0:
-                # Número inválido, não processa como temporada
-                season_only_match = None
-            else:
-                season = season_num_raw.zfill(2)
-                season_str = f"S{season}"
-        except (ValueError, TypeError):
-            # Não é um número válido, não processa como temporada
+        # Evita gerar S00 incorretamente; o grupo (\d{1,2}) garante dígitos, então int() não falha
+        if int(season_num_raw) <= 0:
+            # Número inválido, não processa como temporada
             season_only_match = None
+        else:
+            season_str = _format_season_tag(season_num_raw)
     
     if season_only_match:
         
         # Procura ano no release ou usa year do parâmetro
-        year_from_release = year
-        if not year_from_release:
-            year_match = re.search(r'(19|20)\d{2}', clean_release)
-            if year_match:
-                year_from_release = year_match.group(0)
+        year_from_release = year or _find_year(clean_release)
         
         if year_from_release:
             processed_magnet_text = clean_release[season_only_match.end():]
             # Remove ano do processed_magnet_text se já foi usado
-            processed_magnet_text = re.sub(r'(19|20)\d{2}', '', processed_magnet_text)
+            processed_magnet_text = _strip_years(processed_magnet_text)
             processed_magnet_text = _clean_remaining(processed_magnet_text)
-            return finalize_title(f"{base_title}.{season_str}.{year_from_release}{processed_magnet_text}")
+            return assemble_title(base_title, season_str, year_from_release, processed_magnet_text)
         else:
             # Sem ano, apenas Sx
             processed_magnet_text = clean_release[season_only_match.end():]
             processed_magnet_text = _clean_remaining(processed_magnet_text)
-            return finalize_title(f"{base_title}.{season_str}{processed_magnet_text}")
+            return assemble_title(base_title, season_str, processed_magnet_text)
     
     # FILMES: Title.2022.restodomagnet
-    year_from_release = year
-    if not year_from_release:
-        year_match = re.search(r'(19|20)\d{2}', clean_release)
+    if year:
+        year_from_release = year
+        # Remove anos do clean_release para pegar o resto (informações técnicas)
+        processed_magnet_text = _strip_years(clean_release)
+    else:
+        year_match = _search_year(clean_release)
+        year_from_release = year_match.group(0) if year_match else None
         if year_match:
-            year_from_release = year_match.group(0)
+            # Antes do primeiro ano não há outro; corta o ano encontrado e só varre o trecho seguinte
+            processed_magnet_text = clean_release[:year_match.start()] + _strip_years(clean_release[year_match.end():])
     
     if year_from_release:
-        # Remove ano do clean_release para pegar o resto (informações técnicas)
-        processed_magnet_text = re.sub(r'(19|20)\d{2}', '', clean_release)
-        # Separa componentes colados antes de extrair informações técnicas
-        processed_magnet_text = _split_technical_components(processed_magnet_text)
-        processed_magnet_text = _extract_technical_info(processed_magnet_text)
-        processed_magnet_text = _clean_remaining(processed_magnet_text)
-        return finalize_title(f"{base_title}.{year_from_release}{processed_magnet_text}")
+        processed_magnet_text = _process_release_tail(processed_magnet_text)
+        return assemble_title(base_title, year_from_release, processed_magnet_text)
     
     # Sem ano nem temporada, retorna apenas base_title com informações técnicas se houver
     if clean_release:
-        # Separa componentes colados antes de extrair informações técnicas
-        processed_magnet_text = _split_technical_components(clean_release)
-        processed_magnet_text = _extract_technical_info(processed_magnet_text)
-        processed_magnet_text = _clean_remaining(processed_magnet_text)
-        return finalize_title(f"{base_title}{processed_magnet_text}")
+        processed_magnet_text = _process_release_tail(clean_release)
+        return assemble_title(base_title, processed_magnet_text)
     
     return finalize_title(base_title)
 
+
+# Limpa os caches de normalização de títulos (ex.: entre execuções ou após atualizar regras)
+def clear_title_caches() -> None:
+    _base_title_from_page_title.cache_clear()
+    _clean_release_text.cache_clear()
+    _extract_base_title_from_release.cache_clear()
+    _split_technical_components.cache_clear()
+    _extract_technical_info.cache_clear()
+    _apply_season_temporada_tags.cache_clear()
+    _reorder_title_components.cache_clear()
+    _normalize_release_string.cache_clear()
+    _process_release_tail.cache_clear()
+    _prepare_release_title_cached.cache_clear()
+    _create_standardized_title_cached.cache_clear()
+    with _metadata_name_lock:
+        _metadata_name_cache.clear()
@@ -1,72 +1,204 @@
 """Copyright (c) 2025 DFlexy"""
 """https://github.com/DFlexy"""
 
+import functools
 import re
 from typing import List
 
+from app.config import Config
 from utils.text.cleaning import clean_title, remove_accents
+from utils.text.constants import REGEX_MULTIPLE_DOTS, REGEX_MULTIPLE_SPACES, REGEX_NOT_WORD_OR_DOT, REGEX_SPACES_OR_DOTS
+
+# Tokens técnicos (em maiúsculas) usados para classificar componentes do título
+_QUALITY_TOKENS = frozenset({
+    '1080P', '720P', '480P', '2160P', '4K', 'HD', 'FHD', 'UHD', 'SD', 'HDR', 'FULLHD'
+})
+_SOURCE_TOKENS = frozenset({
+    'WEB-DL', 'WEBRIP', 'BLURAY', 'DVDRIP', 'HDRIP', 'HDTV', 'BDRIP',
+    'BRRIP', 'CAMRIP', 'CAM', 'TSRIP', 'TS', 'TC', 'R5', 'SCR', 'DVDSCR'
+})
+_CODEC_TOKENS = frozenset({
+    'X264', 'X265', 'H.264', 'H.265', 'H264', 'H265', 'AVC', 'HEVC'
+})
+_AUDIO_TOKENS = frozenset({
+    'DUAL', 'DUBLADO', 'DDP5.1', 'ATMOS', 'AC3', 'AAC', 'MP3', 'FLAC', 'DTS', 'NACIONAL', 'LEGENDADO'
+})
+
+# Categoria de cada token técnico (os conjuntos acima não se sobrepõem): uma única consulta por parte
+_TOKEN_CATEGORIES = {
+    **dict.fromkeys(_QUALITY_TOKENS, 'quality'),
+    **dict.fromkeys(_SOURCE_TOKENS, 'source'),
+    **dict.fromkeys(_CODEC_TOKENS, 'codec'),
+    **dict.fromkeys(_AUDIO_TOKENS, 'audio'),
+}
+
+# Primeiros caracteres possíveis de SxxExx/Sxx (ſ casa com S em IGNORECASE)
+_SEASON_FIRST_CHARS = frozenset('Ssſ')
+
+# Tags de formato (minúsculas) aceitas por _ensure_default_format; todas literais, dispensam regex
+# ('cam' e 'ts' já cobrem 'camrip' e 'tsrip')
+_FORMAT_TOKENS = (
+    'web-dl', 'webdl', 'web.dl', 'web dl', 'webrip', 'bluray', 'bdrip', 'hdrip', 'hdtv', 'dvdrip',
+    '2160p', '1080p', '720p', '480p', '4k', 'cam', 'ts', 'uhd', 'fullhd', 'hdr',
+)
+
+# Indicadores ordinais (1ª, 2º) convertidos em uma única passada
+_ORDINAL_TABLE = str.maketrans({'ª': 'a', 'º': 'o'})
+
+# Número da temporada: "1a temporada" / "temporada 1"
+_RE_SEASON_NUM_TEMPORADA = re.compile(r'(\d+)\s*(?:a)?\s*temporada')
+_RE_SEASON_TEMPORADA_NUM = re.compile(r'temporada\s*(?:-|:)?\s*(\d+)')
+
+# Termos redundantes removidos do título final ("2a temporada completa", "temporada", "completo")
+_RE_TEMPORADA_CLEANUP = re.compile(
+    r'\.?\b\d+\s*(?:a)?\s*temporada(?:\s*complet[ao]?)?\b|\.?temporada(?:\s*complet[ao]?)?\b',
+    re.IGNORECASE
+)
+_RE_COMPLETO_CLEANUP = re.compile(r'\.?complet[ao]\b', re.IGNORECASE)
+
+# Regexes compiladas para episódios múltiplos (S02E05-06, S02E05E06E07, S02E01-E05)
+_RE_EP_MULTI = re.compile(r'^S(\d{1,2})E(\d{1,2})(?:[\.\-E](\d{1,2}))+$', re.IGNORECASE)
+_RE_EP_NUMS = re.compile(r'[\.\-E](\d{1,2})', re.IGNORECASE)
+_RE_EP_HYPHEN_PART = re.compile(r'^S(\d{1,2})E(\d{1,2})-(\d{1,2})$', re.IGNORECASE)
+
+# Partes inteiras do título (um componente entre pontos)
+_RE_SXXEXX_PART = re.compile(r'^S(\d{1,2})E(\d{1,2})$', re.IGNORECASE)
+_RE_SEASON_PART = re.compile(r'^S(\d{1,2})$', re.IGNORECASE)
+_RE_SEASON_EPISODE_PART = re.compile(r'^S\d{1,2}(?:E\d{1,2})?$', re.IGNORECASE)
+_RE_YEAR_PART = re.compile(r'^(19|20)\d{2}$')
+_RE_CODEC_ANY_PART = re.compile(r'^(x264|x265|H\.264|H\.265|H264|H265|AVC|HEVC)$', re.IGNORECASE)
+_RE_H_CODEC_PART = re.compile(r'^H(264|265)$', re.IGNORECASE)
+_RE_AUDIO_PART = re.compile(r'^(DUAL|DUBLADO|DDP5\.1|Atmos|AC3|AAC|MP3|FLAC|DTS|NACIONAL|Legendado)$', re.IGNORECASE)
+_RE_OTHER_TECH_PART = re.compile(r'^(HDR|5\.1|2\.0|7\.1|DTS-HD|TrueHD)$', re.IGNORECASE)
+_RE_RELEASE_GROUP_PART_I = re.compile(r'^-[A-Z0-9]+$', re.IGNORECASE)
+_RE_ALNUM_PART = re.compile(r'^[A-Z0-9]+$', re.IGNORECASE)
+_RE_SIZE_PART_NO_SPACE = re.compile(r'^\d+\.?\d*(GB|MB)$', re.IGNORECASE)
+_RE_DUAL_PART = re.compile(r'^DUAL$', re.IGNORECASE)
+_RE_DIGITS_PART = re.compile(r'^\d+$')
+_RE_CHANNELS_PART = re.compile(r'^(5\.1|2\.0|7\.1)(?:-[A-Z0-9]+)?$', re.IGNORECASE)
+_RE_DUAL_CHANNELS_PART = re.compile(r'^DUAL\.(5\.1|2\.0|7\.1)(?:-[A-Z0-9]+)?$', re.IGNORECASE)
+
+# Partes mantidas por _extract_technical_info: uma única união testada com fullmatch por parte
+# (temporada, ano, qualidade, codec, fonte, áudio, áudio com versão, outros, formatos, 5.1-SF, release group, tamanho)
+_RE_TECHNICAL_INFO_PART = re.compile(
+    r'S\d{1,2}'
+    r'|(?:19|20)\d{2}'
+    r'|1080p|720p|480p|2160p|4K|HD|FHD|UHD|SD|HDR|FULLHD'
+    r'|x264|x265|H\.264|H\.265|AVC|HEVC'
+    r'|WEB-DL|WEBRip|BluRay|DVDRip|HDRip|HDTV|BDRip|BRRip|CAMRip|CAM|TSRip|TS|TC|R5|SCR|DVDScr'
+    r'|DUAL|DUBLADO|DDP5\.1|Atmos|AC3|AAC|MP3|FLAC|DTS|NACIONAL|Legendado'
+    r'|(?:AAC|AC3|DTS|DDP)\d+\.\d+'
+    r'|5\.1|2\.0|7\.1|DTS-HD|TrueHD'
+    r'|MKV|MP4|AVI|MPEG|MOV'
+    r'|\d+\.\d+-[A-Z0-9]+'
+    r'|(?-i:-[A-Z0-9]+)'
+    r'|\d+\.?\d*\s*(?:GB|MB)',
+    re.IGNORECASE
+)
+
+# Prefixos removidos do início do release ao extrair o título base (ano e informações técnicas comuns)
+# Cada grupo é opcional e tentado uma vez, nesta ordem: ano, fonte, qualidade, codec
+_RE_LEADING_PREFIXES = re.compile(
+    r'^(?:(?:19|20)\d{2}\.)?'
+    r'(?:(?:WEB-DL|WEBRip|BluRay|DVDRip|HDRip|HDTV|BDRip|BRRip)\.)?'
+    r'(?:(?:1080p|720p|480p|2160p|4K)\.)?'
+    r'(?:(?:x264|x265|H\.264|H\.265)\.)?',
+    re.IGNORECASE
+)
+_RE_GLUED_SEASON_EPISODE = re.compile(r'([A-Za-z0-9]+)(?<!\.)(S\d{1,2}(?:E\d{1,2})?)', re.IGNORECASE)
+_RE_BASE_STOP_TECH = re.compile(r'^(WEB-DL|WEBRip|BluRay|1080p|720p|2160p|FULLHD|x264|x265|DUAL|DUBLADO|HDR)', re.IGNORECASE)
+
+# Detecção de texto já bem formatado em _split_technical_components
+_RE_SEASON_EPISODE_ANY = re.compile(r'S\d{1,2}(?:E\d{1,2})?', re.IGNORECASE)
+_RE_SXXEXX_ANY = re.compile(r'S\d{1,2}E\d{1,2}', re.IGNORECASE)
+_RE_DOTTED_SXXEXX = re.compile(r'\.S\d{1,2}E\d{1,2}\.', re.IGNORECASE)
+_RE_DOTTED_SEASON_ONLY = re.compile(r'\.S\d{1,2}(?![E\d])\.', re.IGNORECASE)
+_RE_DOTTED_RESOLUTION = re.compile(r'\.\d{3,4}p\.', re.IGNORECASE)
+_RE_GLUED_SOURCE_QUALITY = re.compile(
+    r'(WEB-DL|WEBRip|BluRay|DVDRip|HDRip|HDTV|BDRip|BRRip|CAMRip|CAM|TSRip|TS|TC|R5|SCR|DVDScr)'
+    r'(1080p|720p|2160p|480p|4K|UHD|FHD|FULLHD|HD|SD|HDR|x264|x265|H\.264|H\.265|AVC|HEVC)',
+    re.IGNORECASE
+)
+_RE_GLUED_LONG_PART = re.compile(r'(WEB-DL|WEBRip|1080p|720p|x264|x265|LEGENDADO|DUAL)', re.IGNORECASE)
+
+# Trechos preservados durante a separação: DUAL.5.1 (com ou sem -SF), temporadas S01 (não S01E01) e anos
+_RE_PROTECTED_COMPONENTS = re.compile(
+    r'\bDUAL\.(?:5\.1|2\.0|7\.1)(?:-[A-Z0-9]+)?\b|\bS\d{1,2}(?![E\d])\b|\b(?:19|20)\d{2}\b',
+    re.IGNORECASE
+)
+_RE_H_CODEC_WORD = re.compile(r'\bH(264|265)\b', re.IGNORECASE)
+_RE_CODEC_BEFORE_HYPHEN = re.compile(r'(?<!\.)(x264|x265|H\.264|H\.265|AVC|HEVC)(?=-)', re.IGNORECASE)
+_RE_SEASON_ONLY_UNDOTTED = re.compile(r'(?<!\.)(S\d{1,2})(?![E\d])(?!\.)', re.IGNORECASE)
+_RE_YEAR_UNDOTTED = re.compile(r'(?<!\.)((19|20)\d{2})(?!\.)')
+
+# Padrões técnicos conhecidos (em ordem de prioridade - mais específicos primeiro)
+# Usa lookbehind/lookahead negativo para evitar adicionar pontos onde já existem
+_TECH_SPLIT_PATTERNS = (
+    # Fontes (devem vir antes de qualidades para evitar conflito com "WEB")
+    re.compile(r'(?<!\.)(WEB-DL|WEBRip|BluRay|DVDRip|HDRip|HDTV|BDRip|BRRip|CAMRip|CAM|TSRip|TS|TC|R5|SCR|DVDScr)(?!\.)', re.IGNORECASE),
+    # Qualidades (deve vir depois de fontes para evitar conflito)
+    # IMPORTANTE: Não adiciona pontos se já está separado por ponto (ex: .1080p. já está correto)
+    re.compile(r'(?<!\.)(?<!E)(2160p|1080p|720p|480p|4K|UHD|FHD|FULLHD|HD|SD|HDR)(?!\.)', re.IGNORECASE),
+    # Codecs (já processados acima, mas mantém para casos sem hífen)
+    # Suporta tanto H.264 quanto H264 (sem ponto)
+    re.compile(r'(?<!\.)(x264|x265|H\.264|H\.265|H264|H265|AVC|HEVC)(?!\.)', re.IGNORECASE),
+    # Áudio
+    re.compile(r'(?<!\.)(DUAL|DUBLADO|DDP5\.1|Atmos|AC3|AAC|MP3|FLAC|DTS|NACIONAL|Legendado|DTS-HD|TrueHD)(?!\.)', re.IGNORECASE),
+    # Formatos
+    re.compile(r'(?<!\.)(MKV|MP4|AVI|MPEG|MOV)(?!\.)', re.IGNORECASE),
+    # Formatos de áudio com versão: AAC2.0, AC35.1, DTS5.1, etc. (ANTES de separar números decimais genéricos)
+    re.compile(r'(?<!\.)(AAC|AC3|DTS|DDP)\d+\.\d+(?!\.)', re.IGNORECASE),
+    # Áudio específico (5.1, 2.0, 7.1) - cuidado para não quebrar anos ou formatos de áudio
+    re.compile(r'(?<!\.)(\d+\.\d+)(?!\.)(?!\d)', re.IGNORECASE),
+)
+
+# Hífens que fazem parte do nome técnico e não separam release groups
+_RE_HYPHENATED_TECH = re.compile(r'(WEB-DL|DTS-HD)', re.IGNORECASE)
 
 
 # Extrai o núcleo do título removendo informações técnicas redundantes
+# Funções puras de texto: o mesmo release se repete entre trackers/magnets, então são memoizadas
+@functools.lru_cache(maxsize=8192)
 def _extract_base_title_from_release(magnet_processed: str) -> str:
     clean_release = clean_title(magnet_processed)
     clean_release = remove_accents(clean_release)
     
-    # Remove anos do início
-    clean_release = re.sub(r'^(19|20)\d{2}\.', '', clean_release)
-    
-    # Remove informações técnicas comuns do início
-    tech_patterns = [
-        r'^(WEB-DL|WEBRip|BluRay|DVDRip|HDRip|HDTV|BDRip|BRRip)\.',
-        r'^(1080p|720p|480p|2160p|4K)\.',
-        r'^(x264|x265|H\.264|H\.265)\.',
-    ]
-    for pattern in tech_patterns:
-        clean_release = re.sub(pattern, '', clean_release, flags=re.IGNORECASE)
+    # Remove ano e informações técnicas comuns do início (uma única regex ancorada)
+    clean_release = _RE_LEADING_PREFIXES.sub('', clean_release, count=1)
     
     # IMPORTANTE: Preserva pontos existentes no título original
     # Se o título já tem pontos (ex: "One.Punch.Man"), mantém os pontos
     # Se o título tem espaços (ex: "One Punch Man"), converte espaços para pontos
     
-    # Primeiro, normaliza espaços para pontos (mas preserva pontos existentes)
-    # Se já tem pontos, apenas normaliza espaços ao redor dos pontos
-    # Se não tem pontos, converte espaços para pontos
-    if '.' in clean_release:
-        # Já tem pontos, apenas normaliza espaços ao redor dos pontos
-        clean_release = re.sub(r'\s*\.\s*', '.', clean_release)
-        clean_release = re.sub(r'\s+', '.', clean_release)  # Converte espaços restantes para pontos
-    else:
-        # Não tem pontos, converte espaços para pontos
-        clean_release = re.sub(r'\s+', '.', clean_release)
-    
-    # Limpa pontos duplicados
-    clean_release = re.sub(r'\.{2,}', '.', clean_release)
+    # Normaliza espaços para pontos preservando pontos existentes e limpa pontos duplicados
+    # Qualquer sequência de espaços/pontos vira um único ponto (ex: "One . Punch  Man" -> "One.Punch.Man")
+    clean_release = REGEX_SPACES_OR_DOTS.sub('.', clean_release)
     
     # Separa SxxExx colado ao título (ex: "OnePunchManS03E05" -> "OnePunchMan" e "S03E05")
     # Mas preserva pontos existentes (ex: "One.Punch.Man.S03E05" já está correto, não precisa separar)
     # Só separa se não houver ponto antes do SxxExx
     # Usa [A-Za-z0-9] para capturar números também (ex: "OnePunchMan1" -> "OnePunchMan" e "1")
-    clean_release = re.sub(r'([A-Za-z0-9]+)(?<!\.)(S\d{1,2}(?:E\d{1,2})?)', r'\1.\2', clean_release, flags=re.IGNORECASE)
+    clean_release = _RE_GLUED_SEASON_EPISODE.sub(r'\1.\2', clean_release)
     
     # Pega a primeira parte significativa (até encontrar ano ou informação técnica)
     parts = clean_release.split('.')
     base_parts = []
     for part in parts:
         # Para se encontrar SxxExx (já separado)
-        if re.match(r'^S\d{1,2}(?:E\d{1,2})?$', part, re.IGNORECASE):
+        if _RE_SEASON_EPISODE_PART.match(part):
             break
         # Para se encontrar ano
-        if re.match(r'^(19|20)\d{2}$', part):
+        if _RE_YEAR_PART.match(part):
             break
         # Para se encontrar informação técnica comum
-        if re.match(r'^(WEB-DL|WEBRip|BluRay|1080p|720p|2160p|FULLHD|x264|x265|DUAL|DUBLADO|HDR)', part, re.IGNORECASE):
+        if _RE_BASE_STOP_TECH.match(part):
             break
         if part and len(part) > 1:
             base_parts.append(part)
     
     base_title = '.'.join(base_parts)
     base_title = base_title.replace('-', '.').replace('/', '.')  # Converte hífens e barras para pontos
-    base_title = re.sub(r'[^\w\.]', '', base_title)  # Remove tudo exceto letras, números e pontos
+    base_title = REGEX_NOT_WORD_OR_DOT.sub('', base_title)  # Remove tudo exceto letras, números e pontos
     base_title = base_title.strip('.')
     # Capitaliza cada palavra após pontos (preserva capitalização correta: Fate.Stay.Night)
     base_title = '.'.join(word.capitalize() if word else '' for word in base_title.split('.'))
@@ -74,22 +206,42 @@ def _extract_base_title_from_release(magnet_processed: str) -> str:
     return base_title
 
 
+# Aplica a separação técnica em um trecho sem componentes preservados (DUAL.5.1, S01, anos)
+def _split_unprotected_segment(segment: str) -> str:
+    if not segment:
+        return segment
+    
+    # Primeiro, normaliza H264/H265 para H.264/H.265 (adiciona ponto se não tiver)
+    segment = _RE_H_CODEC_WORD.sub(r'H.\1', segment)
+    
+    # Primeiro, separa codecs seguidos de hífens e release groups (ex: x265-ELiTE -> x265.-ELiTE)
+    # Isso garante que codecs sejam separados corretamente mesmo quando seguidos de hífens
+    # O hífen será substituído por ponto depois em _extract_technical_info
+    segment = _RE_CODEC_BEFORE_HYPHEN.sub(r'\1.', segment)
+    
+    # Aplica cada padrão técnico para separar componentes colados
+    for pattern in _TECH_SPLIT_PATTERNS:
+        segment = pattern.sub(r'.\1.', segment)
+    return segment
+
+
 # Separa componentes técnicos colados (ex: "WEB-DL1080px264" -> "WEB-DL.1080p.x264")
+@functools.lru_cache(maxsize=8192)
 def _split_technical_components(text: str) -> str:
     if not text:
         return text
     
     # IMPORTANTE: Preserva padrões já corretos como S01E01, S01, 1080p, etc.
     # Se o texto já contém esses padrões corretos e está bem formatado, não processa
-    if re.search(r'S\d{1,2}(?:E\d{1,2})?', text, re.IGNORECASE):
+    if _RE_SEASON_EPISODE_ANY.search(text):
         # Verifica se o texto já está bem formatado (com pontos separando componentes)
         # Se S01E01, S01 e 1080p já estão separados por pontos, não processa
-        if (re.search(r'\.S\d{1,2}E\d{1,2}\.', text, re.IGNORECASE) or 
-            re.search(r'\.S\d{1,2}(?![E\d])\.', text, re.IGNORECASE) or 
-            re.search(r'\.\d{3,4}p\.', text, re.IGNORECASE)):
+        if (_RE_DOTTED_SXXEXX.search(text) or 
+            _RE_DOTTED_SEASON_ONLY.search(text) or 
+            _RE_DOTTED_RESOLUTION.search(text)):
             # Verifica se há componentes realmente colados que precisam ser separados
             # Se não houver componentes colados (sem espaço entre eles), não processa
-            if not re.search(r'(WEB-DL|WEBRip|BluRay|DVDRip|HDRip|HDTV|BDRip|BRRip|CAMRip|CAM|TSRip|TS|TC|R5|SCR|DVDScr)(1080p|720p|2160p|480p|4K|UHD|FHD|FULLHD|HD|SD|HDR|x264|x265|H\.264|H\.265|AVC|HEVC)', text, re.IGNORECASE):
+            if not _RE_GLUED_SOURCE_QUALITY.search(text):
                 # Se não há componentes colados, retorna sem processar para preservar S01E01, S01 e 1080p
                 return text
     
@@ -98,132 +250,57 @@ def _split_technical_components(text: str) -> str:
         parts = text.split('.')
         # Se já tem mais de 2 partes separadas, verifica se precisa processar
         if len(parts) >= 3:
+            # Sem hífens e sem partes longas não há como ter componentes colados: decide sem regex
+            if '-' not in text and max(map(len, parts)) <= 10:
+                return text
             # Verifica se alguma parte tem componentes colados OU hífens (que precisam ser separados)
             has_colados = any(
-                (re.search(r'(WEB-DL|WEBRip|1080p|720p|x264|x265|LEGENDADO|DUAL)', part, re.IGNORECASE) 
-                 and len(part) > 10)  # Partes muito longas provavelmente têm componentes colados
-                or '-' in part  # Partes com hífens precisam ser processadas (ex: x265-ELiTE)
+                '-' in part  # Partes com hífens precisam ser processadas (ex: x265-ELiTE)
+                or (len(part) > 10  # Partes muito longas provavelmente têm componentes colados
+                    and _RE_GLUED_LONG_PART.search(part))
                 for part in parts
             )
             if not has_colados:
                 return text
     
-    result = text
-    
-    # IMPORTANTE: Preserva anos completos, padrões S01, S02, etc. ANTES de qualquer processamento
-    # Substitui temporariamente por marcadores para evitar que sejam quebrados
-    year_placeholders = {}
-    season_placeholders = {}
-    dual_audio_placeholders = {}
-    year_counter = 0
-    season_counter = 0
-    dual_audio_counter = 0
-    
-    def replace_year(match):
-        nonlocal year_counter
-        year = match.group(0)
-        placeholder = f'__YEAR_{year_counter}__'
-        year_placeholders[placeholder] = year
-        year_counter += 1
-        return placeholder
-    
-    def replace_season(match):
-        nonlocal season_counter
-        season = match.group(0)
-        placeholder = f'__SEASON_{season_counter}__'
-        season_placeholders[placeholder] = season
-        season_counter += 1
-        return placeholder
-    
-    def replace_dual_audio(match):
-        nonlocal dual_audio_counter
-        dual_audio = match.group(0)
-        placeholder = f'__DUAL_AUDIO_{dual_audio_counter}__'
-        dual_audio_placeholders[placeholder] = dual_audio
-        dual_audio_counter += 1
-        return placeholder
-    
-    # IMPORTANTE: Preserva DUAL.5.1, DUAL.2.0, DUAL.7.1 ANTES de qualquer processamento
-    # Esses são informações técnicas de áudio e devem ser mantidos juntos
-    result = re.sub(r'\bDUAL\.(5\.1|2\.0|7\.1)(?:-[A-Z0-9]+)?\b', replace_dual_audio, result, flags=re.IGNORECASE)
-    
-    # Preserva padrões S01, S02, etc. (temporadas completas) antes de processar
-    # IMPORTANTE: Não preserva S01E01 (isso é episódio, não temporada completa)
-    result = re.sub(r'\bS(\d{1,2})(?![E\d])\b', replace_season, result, flags=re.IGNORECASE)
-    
-    # Preserva anos completos (2021, 2023, 2024, etc.) antes de processar
-    result = re.sub(r'\b(19|20)\d{2}\b', replace_year, result)
+    # IMPORTANTE: Preserva DUAL.5.1/2.0/7.1, temporadas S01, S02 (não S01E01) e anos completos
+    # Esses trechos ficam de fora da separação: os padrões técnicos só rodam nos trechos entre eles
+    segments = []
+    last_end = 0
+    for match in _RE_PROTECTED_COMPONENTS.finditer(text):
+        segments.append(_split_unprotected_segment(text[last_end:match.start()]))
+        segments.append(match.group(0))
+        last_end = match.end()
+    segments.append(_split_unprotected_segment(text[last_end:]))
+    result = ''.join(segments)
     
-    # Primeiro, normaliza H264/H265 para H.264/H.265 (adiciona ponto se não tiver)
-    result = re.sub(r'\bH(264|265)\b', r'H.\1', result, flags=re.IGNORECASE)
+    # Adiciona pontos ao redor das temporadas se necessário (após juntar os trechos)
+    result = _RE_SEASON_ONLY_UNDOTTED.sub(r'.\1.', result)
     
-    # Primeiro, separa codecs seguidos de hífens e release groups (ex: x265-ELiTE -> x265.-ELiTE)
-    # Isso garante que codecs sejam separados corretamente mesmo quando seguidos de hífens
-    # O hífen será substituído por ponto depois em _extract_technical_info
-    result = re.sub(r'(?<!\.)(x264|x265|H\.264|H\.265|AVC|HEVC)(?=-)', r'\1.', result, flags=re.IGNORECASE)
-    
-    # Padrões técnicos conhecidos (em ordem de prioridade - mais específicos primeiro)
-    # Usa lookbehind/lookahead negativo para evitar adicionar pontos onde já existem
-    patterns = [
-        # Fontes (devem vir antes de qualidades para evitar conflito com "WEB")
-        (r'(?<!\.)(WEB-DL|WEBRip|BluRay|DVDRip|HDRip|HDTV|BDRip|BRRip|CAMRip|CAM|TSRip|TS|TC|R5|SCR|DVDScr)(?!\.)', r'.\1.', re.IGNORECASE),
-        # Qualidades (deve vir depois de fontes para evitar conflito)
-        # IMPORTANTE: Não adiciona pontos se já está separado por ponto (ex: .1080p. já está correto)
-        (r'(?<!\.)(?<!E)(2160p|1080p|720p|480p|4K|UHD|FHD|FULLHD|HD|SD|HDR)(?!\.)', r'.\1.', re.IGNORECASE),
-        # Codecs (já processados acima, mas mantém para casos sem hífen)
-        # Suporta tanto H.264 quanto H264 (sem ponto)
-        (r'(?<!\.)(x264|x265|H\.264|H\.265|H264|H265|AVC|HEVC)(?!\.)', r'.\1.', re.IGNORECASE),
-        # Áudio
-        (r'(?<!\.)(DUAL|DUBLADO|DDP5\.1|Atmos|AC3|AAC|MP3|FLAC|DTS|NACIONAL|Legendado|DTS-HD|TrueHD)(?!\.)', r'.\1.', re.IGNORECASE),
-        # Formatos
-        (r'(?<!\.)(MKV|MP4|AVI|MPEG|MOV)(?!\.)', r'.\1.', re.IGNORECASE),
-        # Formatos de áudio com versão: AAC2.0, AC35.1, DTS5.1, etc. (ANTES de separar números decimais genéricos)
-        (r'(?<!\.)(AAC|AC3|DTS|DDP)\d+\.\d+(?!\.)', r'.\1.', re.IGNORECASE),
-        # Áudio específico (5.1, 2.0, 7.1) - cuidado para não quebrar anos ou formatos de áudio
-        (r'(?<!\.)(\d+\.\d+)(?!\.)(?!\d)', r'.\1.', re.IGNORECASE),
-    ]
-    
-    # Aplica cada padrão para separar componentes colados
-    for pattern, replacement, flags in patterns:
-        result = re.sub(pattern, replacement, result, flags=flags)
-    
-    # Restaura DUAL.5.1, DUAL.2.0, DUAL.7.1 preservados
-    for placeholder, dual_audio in dual_audio_placeholders.items():
-        result = result.replace(placeholder, dual_audio)
-    
-    # Restaura temporadas preservadas
-    for placeholder, season in season_placeholders.items():
-        result = result.replace(placeholder, season)
-    
-    # Restaura anos completos preservados
-    for placeholder, year in year_placeholders.items():
-        result = result.replace(placeholder, year)
-    
-    # Adiciona pontos ao redor das temporadas se necessário (após restaurar)
-    result = re.sub(r'(?<!\.)(S\d{1,2})(?![E\d])(?!\.)', r'.\1.', result, flags=re.IGNORECASE)
-    
-    # Adiciona pontos ao redor dos anos se necessário (após restaurar)
-    result = re.sub(r'(?<!\.)((19|20)\d{2})(?!\.)', r'.\1.', result)
+    # Adiciona pontos ao redor dos anos se necessário (após juntar os trechos)
+    result = _RE_YEAR_UNDOTTED.sub(r'.\1.', result)
     
     # Limpa pontos duplicados e normaliza
-    result = re.sub(r'\.{2,}', '.', result)
+    if '..' in result:
+        result = REGEX_MULTIPLE_DOTS.sub('.', result)
     result = result.strip('.')
     
     return result
 
 
 # Mantém apenas informações técnicas relevantes (qualidade, codec, etc.)
+@functools.lru_cache(maxsize=8192)
 def _extract_technical_info(text: str) -> str:
     if not text:
         return ''
     
     # Normaliza espaços para pontos
-    text = re.sub(r'\s+', '.', text)
+    text = REGEX_MULTIPLE_SPACES.sub('.', text)
     
     # IMPORTANTE: Processa padrões com hífen ANTES de substituir todos os hífens
     # Isso garante que WEB-DL e DTS-HD sejam reconhecidos corretamente
     # Substitui hífens em padrões técnicos específicos por um marcador temporário
-    text = re.sub(r'(WEB-DL|DTS-HD)', lambda m: m.group(1).replace('-', '___HYPHEN___'), text, flags=re.IGNORECASE)
+    text = _RE_HYPHENATED_TECH.sub(lambda m: m.group(1).replace('-', '___HYPHEN___'), text)
     
     # Substitui hífens restantes por pontos para separar grupos (ex: x265-ELiTE -> x265.ELiTE)
     text = text.replace('-', '.')
@@ -231,7 +308,8 @@ def _extract_technical_info(text: str) -> str:
     # Restaura os padrões com hífen originais
     text = text.replace('___HYPHEN___', '-')
     
-    text = re.sub(r'\.{2,}', '.', text)
+    if '..' in text:
+        text = REGEX_MULTIPLE_DOTS.sub('.', text)
     text = text.strip('.')
     
     if not text:
@@ -249,30 +327,7 @@ def _extract_technical_info(text: str) -> str:
             continue
         
         # Mantém apenas informações técnicas (mesmos padrões da função principal)
-        if re.match(r'^S\d{1,2}$', part_clean, re.IGNORECASE):
-            technical_parts.append(part_clean)
-        elif re.match(r'^(19|20)\d{2}$', part_clean):
-            technical_parts.append(part_clean)
-        elif re.match(r'^(1080p|720p|480p|2160p|4K|HD|FHD|UHD|SD|HDR|FULLHD)$', part_clean, re.IGNORECASE):
-            technical_parts.append(part_clean)
-        elif re.match(r'^(x264|x265|H\.264|H\.265|AVC|HEVC)$', part_clean, re.IGNORECASE):
-            technical_parts.append(part_clean)
-        elif re.match(r'^(WEB-DL|WEBRip|BluRay|DVDRip|HDRip|HDTV|BDRip|BRRip|CAMRip|CAM|TSRip|TS|TC|R5|SCR|DVDScr)$', part_clean, re.IGNORECASE):
-            technical_parts.append(part_clean)
-        elif re.match(r'^(DUAL|DUBLADO|DDP5\.1|Atmos|AC3|AAC|MP3|FLAC|DTS|NACIONAL|Legendado)$', part_clean, re.IGNORECASE):
-            technical_parts.append(part_clean)
-        # Formatos de áudio com versão: AAC2.0, AAC5.1, etc.
-        elif re.match(r'^(AAC|AC3|DTS|DDP)\d+\.\d+$', part_clean, re.IGNORECASE):
-            technical_parts.append(part_clean)
-        elif re.match(r'^(HDR|5\.1|2\.0|7\.1|DTS-HD|TrueHD)$', part_clean, re.IGNORECASE):
-            technical_parts.append(part_clean)
-        elif re.match(r'^(MKV|MP4|AVI|MPEG|MOV)$', part_clean, re.IGNORECASE):
-            technical_parts.append(part_clean)
-        elif re.match(r'^\d+\.\d+-[A-Z0-9]+$', part_clean, re.IGNORECASE):
-            technical_parts.append(part_clean)
-        elif re.match(r'^-[A-Z0-9]+$', part_clean):
-            technical_parts.append(part_clean)
-        elif re.match(r'^\d+\.?\d*\s*(GB|MB)$', part_clean, re.IGNORECASE):
+        if _RE_TECHNICAL_INFO_PART.fullmatch(part_clean):
             technical_parts.append(part_clean)
     
     return '.'.join(technical_parts)
@@ -287,13 +342,12 @@ def _clean_remaining(processed_magnet_text: str) -> str:
     if not processed_magnet_text:
         return ''
     
-    # Remove pontos duplicados
-    processed_magnet_text = re.sub(r'\.{2,}', '.', processed_magnet_text)
-    
-    if processed_magnet_text and not processed_magnet_text.startswith('.'):
-        processed_magnet_text = '.' + processed_magnet_text
+    # Remove pontos duplicados (a regex só roda se houver '..')
+    if '..' in processed_magnet_text:
+        processed_magnet_text = REGEX_MULTIPLE_DOTS.sub('.', processed_magnet_text)
     
-    return processed_magnet_text
+    # Após o strip('.') o texto nunca começa com ponto: basta prefixar
+    return '.' + processed_magnet_text
 
 
 # Garante que o título tenha ao menos uma tag de formato (Web-DL, etc.)
@@ -301,7 +355,7 @@ def _ensure_default_format(title: str) -> str:
     if not title:
         return title
     normalized = title.lower()
-    if re.search(r'(web[-\.\s]?dl|webrip|bluray|bdrip|hdrip|hdtv|dvdrip|2160p|1080p|720p|480p|4k|camrip|cam|tsrip|ts|uhd|fullhd|hdr)', normalized, re.IGNORECASE):
+    if any(token in normalized for token in _FORMAT_TOKENS):
         return title
     if title.endswith('.'):
         return f"{title}WEB-DL"
@@ -309,6 +363,7 @@ def _ensure_default_format(title: str) -> str:
 
 
 # Força inclusão de tags de temporada encontradas na descrição original
+@functools.lru_cache(maxsize=4096)
 def _apply_season_temporada_tags(title: str, magnet_processed: str, original_title_html: str, year: str) -> str:
     if not title:
         return title
@@ -321,8 +376,7 @@ def _apply_season_temporada_tags(title: str, magnet_processed: str, original_tit
     if not context_parts:
         return title
     
-    release_clean = remove_accents(' '.join(context_parts).lower())
-    release_clean = release_clean.replace('ª', 'a').replace('º', 'o')
+    release_clean = remove_accents(' '.join(context_parts).lower()).translate(_ORDINAL_TABLE)
     
     # IMPORTANTE: "Completo/Completa" só faz sentido em séries (temporadas completas), não em filmes
     # Se não tem temporada, é um filme - apenas retorna o título (Completo já foi removido do título base)
@@ -333,9 +387,9 @@ def _apply_season_temporada_tags(title: str, magnet_processed: str, original_tit
     has_completo = 'completo' in release_clean or 'completa' in release_clean
     
     result = title
-    season_match = re.search(r'(\d+)\s*(?:a)?\s*temporada', release_clean)
+    season_match = _RE_SEASON_NUM_TEMPORADA.search(release_clean)
     if not season_match:
-        season_match = re.search(r'temporada\s*(?:-|:)?\s*(\d+)', release_clean)
+        season_match = _RE_SEASON_TEMPORADA_NUM.search(release_clean)
     year_str = str(year) if year else ''
     # IMPORTANTE: Define year_in_title ANTES de usar nos blocos de validação
     year_in_title = year_str and year_str in result
@@ -358,7 +412,7 @@ def _apply_season_temporada_tags(title: str, magnet_processed: str, original_tit
         
         season_number = season_number_raw.zfill(2)
         has_season_info = re.search(rf'S0*{season_number_raw}(?:E\d+(?:-\d+)?|$)', result, re.IGNORECASE)
-        has_any_season_ep = re.search(r'S\d{1,2}E\d{1,2}', result, re.IGNORECASE)
+        has_any_season_ep = _RE_SXXEXX_ANY.search(result)
         
         # Se tem "Completo" junto com temporada, garante que seja temporada completa (Sxx sem Exx)
         # Remove qualquer Exx que possa ter sido adicionado incorretamente
@@ -377,12 +431,10 @@ def _apply_season_temporada_tags(title: str, magnet_processed: str, original_tit
             result = f"{result}.{year_str}"
 
         # Remove termos redundantes de temporada e "Completo" do título
-        result = re.sub(r'\.?\b\d+\s*(?:a)?\s*temporada\s*complet[ao]?\b', '', result, flags=re.IGNORECASE)
-        result = re.sub(r'\.?\b\d+\s*(?:a)?\s*temporada\b', '', result, flags=re.IGNORECASE)
-        result = re.sub(r'\.?temporada\s*complet[ao]?\b', '', result, flags=re.IGNORECASE)
-        result = re.sub(r'\.?temporada\b', '', result, flags=re.IGNORECASE)
-        result = re.sub(r'\.?complet[ao]\b', '', result, flags=re.IGNORECASE)
-        result = re.sub(r'\.{2,}', '.', result)
+        result = _RE_TEMPORADA_CLEANUP.sub('', result)
+        result = _RE_COMPLETO_CLEANUP.sub('', result)
+        if '..' in result:
+            result = REGEX_MULTIPLE_DOTS.sub('.', result)
         result = result.strip('.')
     elif year_str and year_str not in result:
         result = f"{result}.{year_str}"
@@ -390,7 +442,13 @@ def _apply_season_temporada_tags(title: str, magnet_processed: str, original_tit
     return result
 
 
+# Conta as partes que são tags de episódio (S01E01, S01E01E02, S01E01-02...)
+def _count_episode_tags(parts: List[str]) -> int:
+    return sum(1 for part in parts if _RE_SXXEXX_ANY.match(part.strip()))
+
+
 # Reorganiza os componentes do título para manter ordem consistente
+@functools.lru_cache(maxsize=8192)
 def _reorder_title_components(title: str) -> str:
     if not title:
         return title
@@ -411,23 +469,10 @@ def _reorder_title_components(title: str) -> str:
     codec_parts: List[str] = []  # Codec: x264, x265, etc.
     audio_parts: List[str] = []  # Áudio: DUAL, DUBLADO, etc.
     other_parts: List[str] = []  # Outros: HDR, 5.1, release groups, etc.
+    # Conjuntos auxiliares para deduplicação em O(1) (evita recriar listas a cada inserção)
+    seen_quality, seen_codec, seen_audio, seen_source, seen_other = set(), set(), set(), set(), set()
     structure_started = False
     
-    quality_tokens = {
-        '1080P', '720P', '480P', '2160P', '4K', 'HD', 'FHD', 'UHD', 'SD', 'HDR', 'FULLHD'
-    }
-    source_tokens = {
-        'WEB-DL', 'WEBRIP', 'BLURAY', 'DVDRIP', 'HDRIP', 'HDTV', 'BDRIP',
-        'BRRIP', 'CAMRIP', 'CAM', 'TSRIP', 'TS', 'TC', 'R5', 'SCR', 'DVDSCR'
-    }
-    codec_tokens = {
-        'X264', 'X265', 'H.264', 'H.265', 'H264', 'H265', 'AVC', 'HEVC'
-    }
-    audio_tokens = {
-        'DUAL', 'DUBLADO', 'DDP5.1', 'ATMOS', 'AC3', 'AAC', 'MP3', 'FLAC', 'DTS', 'NACIONAL', 'LEGENDADO'
-    }
-    
-    
     # Primeiro, detecta e combina DUAL.5.1, DUAL.2.0, DUAL.7.1 antes de processar
     # Isso garante que esses padrões técnicos sejam preservados como uma única parte
     combined_parts = []
@@ -437,10 +482,10 @@ def _reorder_title_components(title: str) -> str:
         clean_part = part.strip()
         
         # Verifica se é DUAL seguido de 5.1, 2.0 ou 7.1 na próxima parte
-        if i + 1 < len(parts) and re.match(r'^DUAL$', clean_part, re.IGNORECASE):
+        if i + 1 < len(parts) and _RE_DUAL_PART.match(clean_part):
             next_part = parts[i + 1].strip()
             # Verifica se a próxima parte é 5.1, 2.0, 7.1 (com ou sem sufixo como -SF)
-            if re.match(r'^(5\.1|2\.0|7\.1)(?:-[A-Z0-9]+)?$', next_part, re.IGNORECASE):
+            if _RE_CHANNELS_PART.match(next_part):
                 # Combina DUAL.5.1, DUAL.2.0 ou DUAL.7.1
                 combined_parts.append(f"{clean_part}.{next_part}")
                 i += 2  # Pula ambas as partes
@@ -456,148 +501,166 @@ def _reorder_title_components(title: str) -> str:
         if not clean_part:
             continue
         
+        # Padrões de temporada/episódio começam com "S": as demais partes pulam essas regexes
+        may_be_season = clean_part[0] in _SEASON_FIRST_CHARS
+        
         # Verifica episódios múltiplos primeiro: S02E05-06, S02E05E06E07, S02E01-E05, etc.
         # Suporta formatos: S02E01-02 (duplo), S02E01E02E03 (lista explícita), S02E01-E05 (intervalo)
         # Melhorado para capturar S01E01-02 corretamente
-        match_episode_multi = re.match(r'^S(\d{1,2})E(\d{1,2})(?:[\.\-E](\d{1,2}))+$', clean_part, re.IGNORECASE)
-        if match_episode_multi:
+        # Só formata quando o título já tem nome antes da tag e não traz outra tag SxxExx (senão uma delas se perderia)
+        match_episode_multi = _RE_EP_MULTI.match(clean_part) if may_be_season and base_parts else None
+        if match_episode_multi and _count_episode_tags(parts) == 1:
             season = match_episode_multi.group(1).zfill(2)
             episode1 = int(match_episode_multi.group(2))
             episodes = [episode1]
             
             # Extrai todos os números após o primeiro episódio (suporta hífen, ponto e E)
-            # Melhorado para capturar corretamente formatos como S01E01-02
-            episode_numbers = re.findall(r'[\.\-E](\d{1,2})', clean_part)
-            for ep_str in episode_numbers:
-                try:
-                    ep_num = int(ep_str)
-                    from app.config import Config
-                    if ep_num > episodes[-1] and ep_num <= Config.MAX_EPISODE_NUMBER and (ep_num - episodes[-1]) <= Config.MAX_EPISODE_DIFF:
-                        episodes.append(ep_num)
-                    else:
-                        break
-                except (ValueError, TypeError):
+            # A busca começa depois do E01: senão o próprio primeiro episódio interromperia a sequência
+            max_episode = Config.MAX_EPISODE_NUMBER
+            max_diff = Config.MAX_EPISODE_DIFF
+            complete_sequence = True
+            for ep_str in _RE_EP_NUMS.findall(clean_part, match_episode_multi.end(2)):
+                ep_num = int(ep_str)
+                if ep_num > episodes[-1] and ep_num <= max_episode and (ep_num - episodes[-1]) <= max_diff:
+                    episodes.append(ep_num)
+                else:
+                    # Número inválido: não trunca a lista, a parte segue verbatim pelo caminho genérico
+                    complete_sequence = False
                     break
             
-            # Se tem pelo menos 2 episódios válidos, formata como múltiplos
-            if len(episodes) >= 2:
+            # Só formata como múltiplos se todos os números após o primeiro episódio forem válidos
+            if complete_sequence and len(episodes) >= 2:
                 # Novo padrão Sonarr:
                 # - 2 episódios: S02E01-02 (mantém hífen)
                 # - 3-4 episódios: S02E01E02E03 (E repetido - lista explícita)
                 # - 5+ episódios: S02E01-E05 (intervalo - primeiro-último)
                 if len(episodes) == 2:
-                    episode_str = '-'.join(str(ep).zfill(2) for ep in episodes)
+                    episode_str = '-'.join(f'{ep:02d}' for ep in episodes)
                     season_episode = f"S{season}E{episode_str}"
                 elif len(episodes) >= 5:
                     # 5+ episódios: usa formato de intervalo (primeiro-último)
-                    first_ep = str(episodes[0]).zfill(2)
-                    last_ep = str(episodes[-1]).zfill(2)
+                    first_ep = f'{episodes[0]:02d}'
+                    last_ep = f'{episodes[-1]:02d}'
                     season_episode = f"S{season}E{first_ep}-E{last_ep}"
                 elif len(episodes) >= 3:
                     # 3-4 episódios: usa E repetido para lista explícita
-                    episode_str = 'E'.join(str(ep).zfill(2) for ep in episodes)
+                    episode_str = 'E'.join(f'{ep:02d}' for ep in episodes)
                     season_episode = f"S{season}E{episode_str}"
                 else:
-                    episode_str = '-'.join(str(ep).zfill(2) for ep in episodes)
+                    episode_str = '-'.join(f'{ep:02d}' for ep in episodes)
                     season_episode = f"S{season}E{episode_str}"
                 structure_started = True
                 continue
         
         # Verifica também formato S01E01-02 quando não capturado pelo regex acima (fallback)
-        match_episode_hyphen = re.match(r'^S(\d{1,2})E(\d{1,2})-(\d{1,2})$', clean_part, re.IGNORECASE)
+        match_episode_hyphen = _RE_EP_HYPHEN_PART.match(clean_part) if may_be_season else None
         if match_episode_hyphen:
             season = match_episode_hyphen.group(1).zfill(2)
             episode1 = int(match_episode_hyphen.group(2))
             episode2 = int(match_episode_hyphen.group(3))
             if episode2 > episode1 and episode2 <= 99:
-                episode_str = f"{str(episode1).zfill(2)}-{str(episode2).zfill(2)}"
+                episode_str = f"{episode1:02d}-{episode2:02d}"
                 season_episode = f"S{season}E{episode_str}"
                 structure_started = True
                 continue
         
-        match_episode = re.match(r'^S(\d{1,2})E(\d{1,2})$', clean_part, re.IGNORECASE)
+        match_episode = _RE_SXXEXX_PART.match(clean_part) if may_be_season else None
         if match_episode:
             season_episode = f"S{match_episode.group(1).zfill(2)}E{match_episode.group(2).zfill(2)}"
             structure_started = True
             continue
         
-        match_season = re.match(r'^S(\d{1,2})$', clean_part, re.IGNORECASE)
+        match_season = _RE_SEASON_PART.match(clean_part) if may_be_season else None
         if match_season:
             season_only = f"S{match_season.group(1).zfill(2)}"
             structure_started = True
             continue
         
-        if re.match(r'^(19|20)\d{2}$', clean_part):
+        if clean_part[0] in '12' and _RE_YEAR_PART.match(clean_part):
             if not year:
                 year = clean_part
             structure_started = True
             continue
         
         upper_part = clean_part.upper()
+        category = _TOKEN_CATEGORIES.get(upper_part)
         
         # Classifica componentes técnicos na ordem correta
-        if upper_part in quality_tokens:
+        if category == 'quality':
             # Qualidade: 1080p, 720p, etc. (normaliza para minúsculas)
             normalized_quality = clean_part.lower()
-            if normalized_quality not in [q.lower() for q in quality_parts]:
+            if normalized_quality not in seen_quality:
+                seen_quality.add(normalized_quality)
                 quality_parts.append(clean_part)
             structure_started = True
             continue
-        elif upper_part in source_tokens:
+        elif category == 'source':
             # Fonte: WEB-DL, WEBRip, BluRay, etc. (normaliza WEB-DL)
             normalized_source = 'WEB-DL' if upper_part == 'WEB-DL' else clean_part
-            if normalized_source not in source_parts:
+            if normalized_source not in seen_source:
+                seen_source.add(normalized_source)
                 source_parts.append(normalized_source)
             structure_started = True
             continue
-        elif upper_part in codec_tokens or re.match(r'^(x264|x265|H\.264|H\.265|H264|H265|AVC|HEVC)$', clean_part, re.IGNORECASE):
+        elif category == 'codec' or (category is None and _RE_CODEC_ANY_PART.match(clean_part)):
             # Codec: x264, x265, etc. (normaliza H264/H265 para H.264/H.265 e depois para minúsculas)
-            if re.match(r'^H(264|265)$', clean_part, re.IGNORECASE):
+            if _RE_H_CODEC_PART.match(clean_part):
                 clean_part = f'H.{clean_part[1:]}'  # Converte H264 -> H.264
             normalized_codec = clean_part.lower()
-            if normalized_codec not in [c.lower() for c in codec_parts]:
+            if normalized_codec not in seen_codec:
+                seen_codec.add(normalized_codec)
                 codec_parts.append(clean_part)
             structure_started = True
             continue
-        elif upper_part in audio_tokens or re.match(r'^(DUAL|DUBLADO|DDP5\.1|Atmos|AC3|AAC|MP3|FLAC|DTS|NACIONAL|Legendado)$', clean_part, re.IGNORECASE):
+        elif category == 'audio' or (category is None and _RE_AUDIO_PART.match(clean_part)):
             # Áudio: DUAL, DUBLADO, etc. (mantém case original)
             # NOTA: DUAL/DUBLADO/LEGENDADO serão removidos do título final em add_audio_tag_if_needed()
             # quando as tags [Brazilian], [Eng] ou [Leg] forem adicionadas
             # EXCEÇÃO: DUAL.5.1, DUAL.2.0, DUAL.7.1 são preservados (informações técnicas)
             normalized_audio = clean_part.upper()
-            if normalized_audio not in [a.upper() for a in audio_parts]:
+            if normalized_audio not in seen_audio:
+                seen_audio.add(normalized_audio)
                 audio_parts.append(clean_part)
             structure_started = True
             continue
-        elif re.match(r'^DUAL\.(5\.1|2\.0|7\.1)(?:-[A-Z0-9]+)?$', clean_part, re.IGNORECASE):
+        elif _RE_DUAL_CHANNELS_PART.match(clean_part):
             # DUAL.5.1, DUAL.2.0, DUAL.7.1 (com ou sem sufixo como -SF) - preserva como informação técnica
             # Vai para audio_parts mas NÃO será removido em add_audio_tag_if_needed()
-            if clean_part not in audio_parts:
+            normalized_audio = clean_part.upper()
+            if normalized_audio not in seen_audio:
+                seen_audio.add(normalized_audio)
                 audio_parts.append(clean_part)
             structure_started = True
             continue
-        elif re.match(r'^(HDR|5\.1|2\.0|7\.1|DTS-HD|TrueHD)$', clean_part, re.IGNORECASE):
+        elif _RE_OTHER_TECH_PART.match(clean_part):
             # Outros técnicos de áudio/vídeo: HDR, 5.1, 2.0, etc.
             # NOTA: 5.1, 2.0, 7.1 só vão para other_parts se não foram combinados com DUAL
-            if clean_part not in other_parts:
+            other_key = clean_part.lower()
+            if other_key not in seen_other:
+                seen_other.add(other_key)
                 other_parts.append(clean_part)
             structure_started = True
             continue
-        elif re.match(r'^\d+\.?\d*(GB|MB)$', clean_part, re.IGNORECASE):
+        elif _RE_SIZE_PART_NO_SPACE.match(clean_part):
             # Tamanho: não inclui na ordenação técnica
             structure_started = True
             continue
         
-        if re.match(r'^-[A-Z0-9]+$', clean_part, re.IGNORECASE) or (re.match(r'^[A-Z0-9]+$', clean_part, re.IGNORECASE) and structure_started):
+        if _RE_RELEASE_GROUP_PART_I.match(clean_part) or (_RE_ALNUM_PART.match(clean_part) and structure_started):
             # Release groups e outros
-            if clean_part not in other_parts:
+            # Números soltos não são deduplicados: costumam ser o resto de um componente (o "1" de DDP5.1)
+            other_key = clean_part.lower()
+            if other_key not in seen_other or _RE_DIGITS_PART.match(clean_part):
+                seen_other.add(other_key)
                 other_parts.append(clean_part)
             structure_started = True
             continue
         
         if structure_started:
             # Outros componentes técnicos não classificados
-            if clean_part not in other_parts:
+            other_key = clean_part.lower()
+            if other_key not in seen_other:
+                seen_other.add(other_key)
                 other_parts.append(clean_part)
         else:
             base_parts.append(clean_part)
@@ -622,17 +685,8 @@ def _reorder_title_components(title: str) -> str:
     ordered_parts.extend(codec_parts)
     ordered_parts.extend(audio_parts)
     
-    # Remove duplicados dos outros componentes
-    dedup_other = []
-    seen = set()
-    for part in other_parts:
-        key = part.lower()
-        if key in seen:
-            continue
-        seen.add(key)
-        dedup_other.append(part)
-    
-    ordered_parts.extend(dedup_other)
+    # Outros componentes já chegam sem duplicados (seen_other compara sem diferenciar maiúsculas)
+    ordered_parts.extend(other_parts)
     
     return '.'.join(ordered_parts)
 
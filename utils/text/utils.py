@@ -4,6 +4,12 @@
 import re
 from typing import List
 
+# Unidades usadas por format_bytes (potências de 1024)
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+# Tamanho seguido da unidade (ex.: "1.5 GB", "700MB", "2,3GB")
+_RE_SIZE = re.compile(r'(\d+[\.,]?\d+)\s*(GB|MB)')
+
 
 # Procura ano em texto auxiliar ou no próprio título
 def find_year_from_text(text: str, title: str) -> str:
@@ -20,8 +26,7 @@ def find_year_from_text(text: str, title: str) -> str:
 
 # Captura tamanhos (GB/MB) exibidos em texto livre
 def find_sizes_from_text(text: str) -> List[str]:
-    sizes = re.findall(r'(\d+[\.,]?\d+)\s*(GB|MB)', text)
-    return [f"{size[0]} {size[1]}" for size in sizes]
+    return [f"{number} {unit}" for number, unit in _RE_SIZE.findall(text)]
 
 
 # Converte bytes em string legível (KB/MB/GB…)
@@ -32,13 +37,10 @@ def format_bytes(size: int) -> str:
         return ""
     if size <= 0:
         return ""
-    units = ["B", "KB", "MB", "GB", "TB", "PB"]
-    idx = 0
-    value = float(size)
-    while value >= 1024 and idx < len(units) - 1:
-        value /= 1024
-        idx += 1
+    # Cada unidade é 2^10 da anterior: o índice sai direto do número de bits (limitado a PB)
+    idx = min((size.bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
     if idx == 0:
-        return f"{int(value)} {units[idx]}"
-    return f"{value:.2f} {units[idx]}"
+        return f"{size} {_BYTE_UNITS[idx]}"
+    value = size / (1 << (idx * 10))
+    return f"{value:.2f} {_BYTE_UNITS[idx]}"
 